@@ -9,6 +9,7 @@ Reorganized codebase with modular architecture:
 - src/utils/: Utilities (Assets, SpriteSheet)
 """
 
+import logging
 import sys
 import os
 
@@ -20,6 +21,9 @@ from src.game.game import Game
 
 def main():
     """Main entry point for the game."""
+    # Show engine log messages (INFO and up) on the console
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    
     try:
         # Create and run the game
         game = Game(width=800, height=450)
@@ -24,7 +24,7 @@ Usage Examples:
     # Enemy animations
     from src.animations.enemy_animation_loader import create_enemy_loader
     assassin_loader = create_enemy_loader("assassin", "assets/assassin.json", scale=2)
-    assassin_loader.load_assassin_animations()
+    assassin_loader.load_enemy_animations()
     
     # Interactable animations
     from src.animations.interactable_animation_loader import create_interactable_loader
@@ -32,7 +32,7 @@ Usage Examples:
     chest_loader.load_chest_animations()
 """
 
-from .base_animation_loader import BaseAnimationLoader
+from .base_animation_loader import BaseAnimationLoader, AnimationFrames
 from .entity_animation_loader import EntityAnimationLoader
 from .player_animation_loader import PlayerAnimationLoader
 from .enemy_animation_loader import (
@@ -62,6 +62,7 @@ from .npc_animation_loader import (
 __all__ = [
     # Base classes
     'BaseAnimationLoader',
+    'AnimationFrames',
     'EntityAnimationLoader',
     
     # Player animations
@@ -12,11 +12,78 @@ entity-specific animation loaders inherit from. It provides:
 All entity-specific loaders (Player, Enemy, etc.) build upon this foundation.
 """
 
+import bisect
+import functools
+import itertools
+import logging
 import os
+import weakref
+from dataclasses import dataclass
 import pygame
 from typing import Dict, List, Tuple, Optional, Any
 from ..utils.aseprite_loader import AsepriteLoader, AsepriteAnimation, AsepriteFrame
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AnimationFrames:
+    """
+    Frame data for a single animation state.
+    
+    Each per-frame list is indexed by frame number, so render code can pick the
+    list for the current facing once and index it directly. end_times holds the
+    running total of durations, so the frame at a given time is one bisect.
+    """
+    __slots__ = ('surfaces_right', 'surfaces_left', 'pivots_right', 'pivots_left',
+                 'durations', 'direction', 'frame_count', 'end_times', '__weakref__')
+    
+    surfaces_right: List[pygame.Surface]
+    surfaces_left: List[pygame.Surface]
+    pivots_right: List[Tuple[int, int]]
+    pivots_left: List[Tuple[int, int]]
+    durations: List[float]
+    direction: str
+    frame_count: int
+    
+    def __post_init__(self):
+        self.end_times = list(itertools.accumulate(self.durations))
+        
+    def frame_index_at(self, elapsed: float) -> int:
+        """Get the frame shown at a time within one loop (0 <= elapsed < end_times[-1])."""
+        return min(bisect.bisect_right(self.end_times, elapsed), self.frame_count - 1)
+
+
+# Canonical AnimationFrames shared by every loader that slices the same frames.
+# Keyed by surface identity, which is stable because the interned object keeps its
+# surfaces alive; entries vanish once no loader references the animation.
+_ANIMATION_INTERN: "weakref.WeakValueDictionary[tuple, AnimationFrames]" = weakref.WeakValueDictionary()
+
+
+@functools.lru_cache(maxsize=32)
+def _make_placeholder(width: int, height: int, color: Tuple[int, int, int]) -> Tuple[pygame.Surface, pygame.Surface]:
+    """Build (or reuse) a filled placeholder surface for both facings."""
+    placeholder = pygame.Surface((width, height), pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        placeholder = placeholder.convert_alpha()  # Display pixel format for faster blits
+    placeholder.fill(color)
+    # A solid fill is its own mirror image, so one surface serves both facings
+    return placeholder, placeholder
+
+
+def _intern_animation(anim: AnimationFrames) -> AnimationFrames:
+    """Return the canonical instance for animations with identical frame data."""
+    key = (
+        tuple(map(id, anim.surfaces_right)),
+        tuple(anim.pivots_right),
+        tuple(anim.durations),
+        anim.direction,
+    )
+    canonical = _ANIMATION_INTERN.get(key)
+    if canonical is None:
+        _ANIMATION_INTERN[key] = canonical = anim
+    return canonical
+
 
 class BaseAnimationLoader:
     """
@@ -35,6 +102,9 @@ class BaseAnimationLoader:
     - Common animation utilities
     """
     
+    __slots__ = ('scale', 'json_path', 'aseprite_loader', 'animations',
+                 '_animation_names', 'pivot_point', 'loaded')
+    
     def __init__(self, json_path: str, scale: int = 2):
         """
         Initialize the base animation loader.
@@ -46,7 +116,8 @@ class BaseAnimationLoader:
         self.scale = scale
         self.json_path = json_path
         self.aseprite_loader = AsepriteLoader(json_path, scale=scale)
-        self.animations: Dict[str, Dict] = {}
+        self.animations: Dict[str, AnimationFrames] = {}
+        self._animation_names: Tuple[str, ...] = ()
         self.pivot_point: Tuple[int, int] = (0, 0)
         self.loaded = False
         
@@ -57,19 +128,25 @@ class BaseAnimationLoader:
         Returns:
             bool: True if loading succeeded, False otherwise
         """
+        # Aseprite data already parsed: only the pivot point is needed
+        if self.aseprite_loader.is_loaded:
+            self.pivot_point = self.aseprite_loader.get_scaled_pivot()
+            self.loaded = True
+            return True
+            
         if not os.path.exists(self.json_path):
-            print(f"Warning: Animation file not found: {self.json_path}")
+            logger.warning("Animation file not found: %s", self.json_path)
             self._create_fallback_animations()
             return False
             
         if not self.aseprite_loader.load():
-            print(f"Failed to load Aseprite data from {self.json_path}")
+            logger.warning("Failed to load Aseprite data from %s", self.json_path)
             self._create_fallback_animations()
             return False
             
         # Get pivot point from Aseprite data
         self.pivot_point = self.aseprite_loader.get_scaled_pivot()
-        print(f"Found pivot point at {self.pivot_point}")
+        logger.debug("Found pivot point at %s", self.pivot_point)
         
         self.loaded = True
         return True
@@ -86,56 +163,55 @@ class BaseAnimationLoader:
             bool: True if animation was loaded successfully
         """
         if not self.loaded:
-            print(f"Warning: Attempted to load animation '{state_name}' before calling load()")
+            logger.warning("Attempted to load animation '%s' before calling load()", state_name)
             return False
             
         animation = self.aseprite_loader.get_animation(aseprite_name)
         if not animation:
-            print(f"Warning: Animation '{aseprite_name}' not found in Aseprite data")
+            logger.warning("Animation '%s' not found in Aseprite data", aseprite_name)
             return False
             
+        # Bind loop invariants to locals once instead of per frame
+        frames = animation.frames
+        get_frame_surface = self.aseprite_loader.get_frame_surface
+        get_flipped_frame_surface = self.aseprite_loader.get_flipped_frame_surface
+        pivot_x, pivot_y = self.pivot_point
+        right_pivot = (pivot_x, pivot_y)
+        
         # Convert to game format
         right_surfaces = []
         left_surfaces = []
-        pivots_right = []
-        pivots_left = []
-        durations = []
         
-        for frame in animation.frames:
-            # Extract frame surface from sprite sheet
-            surface = self.aseprite_loader.get_frame_surface(frame)
-            
-            # Create horizontally flipped version for left-facing direction
-            flipped_surface = pygame.transform.flip(surface, True, False)
-            
-            right_surfaces.append(surface)
-            left_surfaces.append(flipped_surface)
-            
-            # Calculate pivot points
-            pivot_x, pivot_y = self.pivot_point
-            
-            # Right-facing: use pivot as-is
-            pivots_right.append((pivot_x, pivot_y))
-            
-            # Left-facing: flip X coordinate
-            flipped_pivot_x = surface.get_width() - pivot_x
-            pivots_left.append((flipped_pivot_x, pivot_y))
-            
-            # Convert frame duration from milliseconds to seconds
-            durations.append(frame.duration / 1000.0)
+        for frame in frames:
+            # Extract frame surface and its horizontally flipped (left-facing) version
+            right_surfaces.append(get_frame_surface(frame))
+            left_surfaces.append(get_flipped_frame_surface(frame))
             
+        # Right-facing: use pivot as-is
+        pivots_right = [right_pivot] * len(frames)
+        
+        # Left-facing: mirror the pivot X across each frame's scaled width
+        # (taken from the Aseprite frame data, so no surface queries are needed)
+        scale = self.scale
+        pivots_left = [(frame.width * scale - pivot_x, pivot_y) for frame in frames]
+        
+        # Convert frame durations from milliseconds to seconds
+        durations = [frame.duration / 1000.0 for frame in frames]
+        
         # Store animation data in standardized format
-        self.animations[state_name] = {
-            'surfaces_right': right_surfaces,
-            'surfaces_left': left_surfaces,
-            'pivots_right': pivots_right,
-            'pivots_left': pivots_left,
-            'durations': durations,
-            'direction': animation.direction,
-            'frame_count': len(right_surfaces)
-        }
-        
-        print(f"Loaded animation '{state_name}' with {len(right_surfaces)} frames")
+        # (reusing an identical animation already loaded by another loader)
+        frame_count = len(right_surfaces)
+        self.animations[state_name] = _intern_animation(AnimationFrames(
+            surfaces_right=right_surfaces,
+            surfaces_left=left_surfaces,
+            pivots_right=pivots_right,
+            pivots_left=pivots_left,
+            durations=durations,
+            direction=animation.direction,
+            frame_count=frame_count
+        ))
+        
+        logger.debug("Loaded animation '%s' with %d frames", state_name, frame_count)
         return True
         
     def _create_fallback_animations(self):
@@ -146,34 +222,30 @@ class BaseAnimationLoader:
         Subclasses can override this to provide entity-specific fallbacks.
         """
         # Create a simple colored rectangle as placeholder
-        placeholder_size = (60 * self.scale, 60 * self.scale)
-        placeholder = pygame.Surface(placeholder_size, pygame.SRCALPHA)
-        placeholder.fill((200, 80, 80))  # Red placeholder
-        
-        flipped_placeholder = pygame.transform.flip(placeholder, True, False)
+        placeholder, flipped_placeholder = _make_placeholder(60 * self.scale, 60 * self.scale, (200, 80, 80))
         
         # Default pivot point (bottom center)
         pivot_x = 30 * self.scale
         pivot_y = 59 * self.scale
         
-        placeholder_data = {
-            'surfaces_right': [placeholder],
-            'surfaces_left': [flipped_placeholder],
-            'pivots_right': [(pivot_x, pivot_y)],
-            'pivots_left': [(pivot_x, pivot_y)],
-            'durations': [0.1],  # 100ms default
-            'direction': 'forward',
-            'frame_count': 1
-        }
+        placeholder_data = AnimationFrames(
+            surfaces_right=[placeholder],
+            surfaces_left=[flipped_placeholder],
+            pivots_right=[(pivot_x, pivot_y)],
+            pivots_left=[(pivot_x, pivot_y)],
+            durations=[0.1],  # 100ms default
+            direction='forward',
+            frame_count=1
+        )
         
         # Create basic fallback animations
         basic_animations = ['idle', 'walk', 'jump', 'fall']
         for anim_name in basic_animations:
-            self.animations[anim_name] = placeholder_data.copy()
+            self.animations[anim_name] = placeholder_data  # read-only, shared by every name
             
-        print(f"Created {len(basic_animations)} fallback animations")
+        logger.debug("Created %d fallback animations", len(basic_animations))
         
-    def get_animation(self, name: str) -> Optional[Dict]:
+    def get_animation(self, name: str) -> Optional[AnimationFrames]:
         """
         Get animation data by name.
         
@@ -181,13 +253,13 @@ class BaseAnimationLoader:
             name: Animation state name
             
         Returns:
-            Dictionary containing animation data or None if not found
+            AnimationFrames for the animation or None if not found
         """
         return self.animations.get(name)
         
-    def get_frame_surface(self, animation_name: str, frame_index: int, facing_right: bool = True) -> Optional[pygame.Surface]:
+    def get_frame(self, animation_name: str, frame_index: int, facing_right: bool = True) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
         """
-        Get a specific frame surface from an animation.
+        Get the surface and pivot for a frame in a single lookup.
         
         Args:
             animation_name: Name of the animation
@@ -195,18 +267,58 @@ class BaseAnimationLoader:
             facing_right: True for right-facing, False for left-facing
             
         Returns:
-            pygame.Surface or None if frame not found
+            Tuple of (surface, pivot) or None if frame not found
+        """
+        anim = self.get_animation(animation_name)
+        if anim is None or not 0 <= frame_index < anim.frame_count:
+            return None
+            
+        if facing_right:
+            return anim.surfaces_right[frame_index], anim.pivots_right[frame_index]
+        return anim.surfaces_left[frame_index], anim.pivots_left[frame_index]
+        
+    def get_blit_args(self, animation_name: str, frame_index: int, facing_right: bool,
+                      base_pos: Tuple[float, float]) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
         """
-        anim_data = self.get_animation(animation_name)
-        if not anim_data:
+        Get a (surface, position) pair ready for Surface.blit or Surface.blits.
+        
+        The position is the top-left corner that places the frame's pivot on
+        base_pos, so callers can collect pairs for many entities and draw them
+        with a single Surface.blits() call.
+        
+        Args:
+            animation_name: Name of the animation
+            frame_index: Index of the frame (0-based)
+            facing_right: True for right-facing, False for left-facing
+            base_pos: Screen position of the pivot (e.g. the entity's feet)
+            
+        Returns:
+            Tuple of (surface, (x, y)) or None if frame not found
+        """
+        frame = self.get_frame(animation_name, frame_index, facing_right)
+        if frame is None:
             return None
             
-        surfaces = anim_data['surfaces_right'] if facing_right else anim_data['surfaces_left']
+        surface, (pivot_x, pivot_y) = frame
+        return surface, (int(base_pos[0] - pivot_x), int(base_pos[1] - pivot_y))
         
-        if frame_index < 0 or frame_index >= len(surfaces):
+    def get_frame_surface(self, animation_name: str, frame_index: int, facing_right: bool = True) -> Optional[pygame.Surface]:
+        """
+        Get a specific frame surface from an animation.
+        
+        Args:
+            animation_name: Name of the animation
+            frame_index: Index of the frame (0-based)
+            facing_right: True for right-facing, False for left-facing
+            
+        Returns:
+            pygame.Surface or None if frame not found
+        """
+        anim = self.get_animation(animation_name)
+        if anim is None or not 0 <= frame_index < anim.frame_count:
             return None
             
-        return surfaces[frame_index]
+        return (anim.surfaces_right if facing_right else anim.surfaces_left)[frame_index]
         
     def get_frame_pivot(self, animation_name: str, frame_index: int, facing_right: bool = True) -> Optional[Tuple[int, int]]:
         """
@@ -220,16 +332,11 @@ class BaseAnimationLoader:
         Returns:
             Tuple of (x, y) pivot coordinates or None if frame not found
         """
-        anim_data = self.get_animation(animation_name)
-        if not anim_data:
+        anim = self.get_animation(animation_name)
+        if anim is None or not 0 <= frame_index < anim.frame_count:
             return None
             
-        pivots = anim_data['pivots_right'] if facing_right else anim_data['pivots_left']
-        
-        if frame_index < 0 or frame_index >= len(pivots):
-            return None
-            
-        return pivots[frame_index]
+        return (anim.pivots_right if facing_right else anim.pivots_left)[frame_index]
         
     def get_frame_duration(self, animation_name: str, frame_index: int) -> float:
         """
@@ -242,11 +349,31 @@ class BaseAnimationLoader:
         Returns:
             Frame duration in seconds (default: 0.1)
         """
-        anim_data = self.get_animation(animation_name)
-        if not anim_data or frame_index < 0 or frame_index >= len(anim_data['durations']):
+        anim = self.get_animation(animation_name)
+        if anim is None or not 0 <= frame_index < anim.frame_count:
             return 0.1  # Default 100ms
             
-        return anim_data['durations'][frame_index]
+        return anim.durations[frame_index]
+        
+    def get_frame_index_at(self, animation_name: str, elapsed: float) -> int:
+        """
+        Get the frame shown after playing a looping animation for a given time.
+        
+        Args:
+            animation_name: Name of the animation
+            elapsed: Time since the animation started, in seconds
+            
+        Returns:
+            Frame index (0 if the animation doesn't exist)
+        """
+        anim = self.get_animation(animation_name)
+        if anim is None or not anim.end_times:
+            return 0
+            
+        total = anim.end_times[-1]
+        if total > 0:
+            elapsed %= total
+        return anim.frame_index_at(elapsed)
         
     def get_animation_direction(self, animation_name: str) -> str:
         """
@@ -258,11 +385,11 @@ class BaseAnimationLoader:
         Returns:
             Animation direction ('forward', 'reverse', 'pingpong')
         """
-        anim_data = self.get_animation(animation_name)
-        if not anim_data:
+        anim = self.get_animation(animation_name)
+        if anim is None:
             return 'forward'
             
-        return anim_data['direction']
+        return anim.direction
         
     def get_frame_count(self, animation_name: str) -> int:
         """
@@ -274,11 +401,11 @@ class BaseAnimationLoader:
         Returns:
             Number of frames (0 if animation not found)
         """
-        anim_data = self.get_animation(animation_name)
-        if not anim_data:
+        anim = self.get_animation(animation_name)
+        if anim is None:
             return 0
             
-        return anim_data['frame_count']
+        return anim.frame_count
         
     def has_animation(self, animation_name: str) -> bool:
         """
@@ -292,14 +419,19 @@ class BaseAnimationLoader:
         """
         return animation_name in self.animations
         
-    def list_animations(self) -> List[str]:
+    def list_animations(self) -> Tuple[str, ...]:
         """
-        Get a list of all available animation names.
+        Get all available animation names.
+        
+        The tuple is cached and only rebuilt when animations have been added
+        (animations are never removed, so a size change is enough to detect it).
         
         Returns:
-            List of animation names
+            Tuple of animation names
         """
-        return list(self.animations.keys())
+        if len(self._animation_names) != len(self.animations):
+            self._animation_names = tuple(self.animations)
+        return self._animation_names
         
     def get_legacy_format(self, name: str) -> Tuple[List, List, List, List]:
         """
@@ -314,13 +446,13 @@ class BaseAnimationLoader:
         Returns:
             Tuple of (surfaces_right, surfaces_left, pivots_right, pivots_left)
         """
-        anim_data = self.get_animation(name)
-        if not anim_data:
+        anim = self.get_animation(name)
+        if anim is None:
             return ([], [], [], [])
             
         return (
-            anim_data['surfaces_right'],
-            anim_data['surfaces_left'],
-            anim_data['pivots_right'],
-            anim_data['pivots_left']
+            anim.surfaces_right,
+            anim.surfaces_left,
+            anim.pivots_right,
+            anim.pivots_left
         )
\ No newline at end of file
@@ -13,10 +13,15 @@ Each enemy type defines its own animation mappings and required animations
 while inheriting common enemy behavior from the base enemy loader.
 """
 
-from typing import Dict
-import pygame
+import logging
+import sys
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+from .base_animation_loader import AnimationFrames, _make_placeholder
 from .entity_animation_loader import EntityAnimationLoader
 
+logger = logging.getLogger(__name__)
+
 
 class EnemyAnimationLoader(EntityAnimationLoader):
     """
@@ -31,20 +36,55 @@ class EnemyAnimationLoader(EntityAnimationLoader):
     - Enemy-specific fallback mechanisms  
     - AI state animation support
     - Enemy health state animations
+    
+    Enemy types are declared purely through class attributes: ENEMY_TYPE,
+    ANIMATIONS, REQUIRED_ANIMATIONS and FALLBACK_CHAINS. The base class
+    applies them on construction and loads them in load_enemy_animations().
     """
     
-    def __init__(self, json_path: str, scale: int = 2, enemy_type: str = "generic"):
+    __slots__ = ('enemy_type',)
+    
+    # Enemy configuration (overridden by each enemy type)
+    ENEMY_TYPE = "generic"
+    ANIMATIONS: Dict[str, str] = {}
+    REQUIRED_ANIMATIONS: Tuple[str, ...] = ()
+    FALLBACK_CHAINS: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+    
+    def __init__(self, json_path: str, scale: int = 2, enemy_type: str = None):
         """
         Initialize enemy animation loader.
         
         Args:
             json_path: Path to enemy Aseprite JSON file
             scale: Scale factor for rendering
-            enemy_type: Specific type of enemy
+            enemy_type: Specific type of enemy (defaults to the class ENEMY_TYPE)
         """
+        if enemy_type is None:
+            enemy_type = self.ENEMY_TYPE
         super().__init__(json_path, scale, entity_type=f"Enemy-{enemy_type}")
         self.enemy_type = enemy_type
         
+        # Set up type-specific configuration
+        self._apply_class_schema()
+            
+    def load_enemy_animations(self) -> bool:
+        """
+        Load all animations declared for this enemy type.
+        
+        Returns:
+            bool: True if the enemy animations were loaded successfully
+        """
+        success = self.load_animations(self.ANIMATIONS)
+        
+        if success:
+            logger.debug("%s animation system loaded: %d animations, pivot %s, scale %dx",
+                         self.enemy_type, len(self.animations), self.pivot_point, self.scale)
+            
+            # Validate required animations (logs any missing ones)
+            self.validate_animations()
+                
+        return success
+        
     def _create_fallback_animations(self):
         """
         Create enemy-specific fallback animations.
@@ -52,32 +92,28 @@ class EnemyAnimationLoader(EntityAnimationLoader):
         Creates basic enemy sprite placeholder when Aseprite data fails to load.
         """
         # Create enemy-specific placeholder (red color for enemies)
-        placeholder_size = (40 * self.scale, 40 * self.scale)
-        placeholder = pygame.Surface(placeholder_size, pygame.SRCALPHA)
-        placeholder.fill((255, 80, 80))  # Red color for enemies
-        
-        flipped_placeholder = pygame.transform.flip(placeholder, True, False)
+        placeholder, flipped_placeholder = _make_placeholder(40 * self.scale, 40 * self.scale, (255, 80, 80))
         
         # Enemy-specific pivot point (bottom center)
         pivot_x = 20 * self.scale
         pivot_y = 39 * self.scale
         
-        placeholder_data = {
-            'surfaces_right': [placeholder],
-            'surfaces_left': [flipped_placeholder],
-            'pivots_right': [(pivot_x, pivot_y)],
-            'pivots_left': [(pivot_x, pivot_y)],
-            'durations': [0.15],  # Slightly slower for enemies
-            'direction': 'forward',
-            'frame_count': 1
-        }
+        placeholder_data = AnimationFrames(
+            surfaces_right=[placeholder],
+            surfaces_left=[flipped_placeholder],
+            pivots_right=[(pivot_x, pivot_y)],
+            pivots_left=[(pivot_x, pivot_y)],
+            durations=[0.15],  # Slightly slower for enemies
+            direction='forward',
+            frame_count=1
+        )
         
         # Create basic enemy animations
         basic_enemy_anims = ['idle', 'run', 'attack1', 'hit', 'death']
         for anim_name in basic_enemy_anims:
-            self.animations[anim_name] = placeholder_data.copy()
+            self.animations[anim_name] = placeholder_data  # read-only, shared by every name
             
-        print(f"Created {len(basic_enemy_anims)} enemy fallback animations")
+        logger.debug("Created %d enemy fallback animations", len(basic_enemy_anims))
 
 
 class AssassinAnimationLoader(EnemyAnimationLoader):
@@ -94,8 +130,12 @@ class AssassinAnimationLoader(EnemyAnimationLoader):
     - Special: spawn (if available)
     """
     
+    __slots__ = ()
+    
+    ENEMY_TYPE = "Assassin"
+    
     # Assassin animation mappings
-    ASSASSIN_ANIMATIONS = {
+    ANIMATIONS = {
         'idle': 'idle',
         'run': 'run',
         'jump': 'jump',
@@ -108,62 +148,25 @@ class AssassinAnimationLoader(EnemyAnimationLoader):
         'spawn': 'spawn',  # May not exist in all assassin sprites
     }
     
+    # Loaded on first use (most assassins never play their spawn animation)
+    OPTIONAL_ANIMATIONS = {'spawn'}
+    
     # Required animations for Assassin to function
-    REQUIRED_ANIMATIONS = [
+    REQUIRED_ANIMATIONS = (
         'idle', 'run', 'attack1', 'hit', 'death'
-    ]
+    )
     
     # Fallback chains for Assassin animations
-    FALLBACK_CHAINS = {
-        'run': ['idle'],
-        'jump': ['idle'],
-        'fall': ['jump', 'idle'],
-        'attack2': ['attack1'],
-        'hit': ['idle'],
-        'death': ['hit', 'idle'],
-        'spawn': ['idle'],
-    }
+    FALLBACK_CHAINS = MappingProxyType({
+        'run': ('idle',),
+        'jump': ('idle',),
+        'fall': ('jump', 'idle'),
+        'attack2': ('attack1',),
+        'hit': ('idle',),
+        'death': ('hit', 'idle'),
+        'spawn': ('idle',),
+    })
     
-    def __init__(self, json_path: str, scale: int = 2):
-        """
-        Initialize Assassin animation loader.
-        
-        Args:
-            json_path: Path to Assassin Aseprite JSON file
-            scale: Scale factor for rendering
-        """
-        super().__init__(json_path, scale, enemy_type="Assassin")
-        
-        # Set up Assassin-specific configuration
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        
-        # Set up fallback chains
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
-            
-    def load_assassin_animations(self) -> bool:
-        """
-        Load all Assassin animations.
-        
-        Returns:
-            bool: True if Assassin animations were loaded successfully
-        """
-        success = self.load_animations(self.ASSASSIN_ANIMATIONS)
-        
-        if success:
-            print(f"Assassin animation system loaded successfully:")
-            print(f"  - {len(self.animations)} animations loaded")
-            print(f"  - Pivot point: {self.pivot_point}")
-            print(f"  - Scale: {self.scale}x")
-            
-            # Validate required animations
-            if self.validate_animations():
-                print("  - All required Assassin animations validated ✓")
-            else:
-                print("  - Some required Assassin animations missing ⚠")
-                
-        return success
-        
     def has_advanced_attacks(self) -> bool:
         """
         Check if advanced attack animations are available.
@@ -173,7 +176,7 @@ class AssassinAnimationLoader(EnemyAnimationLoader):
         """
         return self.has_animation('attack2')
         
-    def get_ai_animations(self) -> Dict[str, Dict]:
+    def get_ai_animations(self) -> Dict[str, AnimationFrames]:
         """
         Get animations used by AI system.
         
@@ -197,8 +200,12 @@ class ArcherAnimationLoader(EnemyAnimationLoader):
     - Health: hit, death
     """
     
+    __slots__ = ()
+    
+    ENEMY_TYPE = "Archer"
+    
     # Archer animation mappings (placeholder - adjust based on actual sprite)
-    ARCHER_ANIMATIONS = {
+    ANIMATIONS = {
         'idle': 'Idle',
         'walk': 'Walk',
         'retreat': 'Retreat',  # Or fallback to walk
@@ -209,29 +216,21 @@ class ArcherAnimationLoader(EnemyAnimationLoader):
         'death': 'Death',
     }
     
-    REQUIRED_ANIMATIONS = [
+    # Loaded on first use
+    OPTIONAL_ANIMATIONS = {'retreat', 'reload'}
+    
+    REQUIRED_ANIMATIONS = (
         'idle', 'walk', 'aim', 'shoot', 'hit', 'death'
-    ]
-    
-    FALLBACK_CHAINS = {
-        'walk': ['idle'],
-        'retreat': ['walk', 'idle'],
-        'shoot': ['aim', 'idle'],
-        'reload': ['idle'],
-        'hit': ['idle'],
-        'death': ['hit', 'idle'],
-    }
+    )
     
-    def __init__(self, json_path: str, scale: int = 2):
-        """Initialize Archer animation loader."""
-        super().__init__(json_path, scale, enemy_type="Archer")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
-            
-    def load_archer_animations(self) -> bool:
-        """Load all Archer animations."""
-        return self.load_animations(self.ARCHER_ANIMATIONS)
+    FALLBACK_CHAINS = MappingProxyType({
+        'walk': ('idle',),
+        'retreat': ('walk', 'idle'),
+        'shoot': ('aim', 'idle'),
+        'reload': ('idle',),
+        'hit': ('idle',),
+        'death': ('hit', 'idle'),
+    })
 
 
 class WaspAnimationLoader(EnemyAnimationLoader):
@@ -247,8 +246,12 @@ class WaspAnimationLoader(EnemyAnimationLoader):
     - Health: hit, death
     """
     
+    __slots__ = ()
+    
+    ENEMY_TYPE = "Wasp"
+    
     # Wasp animation mappings (placeholder - adjust based on actual sprite)
-    WASP_ANIMATIONS = {
+    ANIMATIONS = {
         'hover': 'Hover',
         'fly': 'Fly',
         'dive': 'Dive',
@@ -259,33 +262,30 @@ class WaspAnimationLoader(EnemyAnimationLoader):
         'death': 'Death',
     }
     
-    REQUIRED_ANIMATIONS = [
+    REQUIRED_ANIMATIONS = (
         'hover', 'fly', 'attack', 'hit', 'death'
-    ]
-    
-    FALLBACK_CHAINS = {
-        'fly': ['hover'],
-        'dive': ['fly', 'hover'],
-        'rise': ['fly', 'hover'],
-        'sting': ['attack', 'hover'],
-        'hit': ['hover'],
-        'death': ['hit', 'hover'],
-    }
+    )
+    
+    FALLBACK_CHAINS = MappingProxyType({
+        'fly': ('hover',),
+        'dive': ('fly', 'hover'),
+        'rise': ('fly', 'hover'),
+        'sting': ('attack', 'hover'),
+        'hit': ('hover',),
+        'death': ('hit', 'hover'),
+    })
     
-    def __init__(self, json_path: str, scale: int = 2):
-        """Initialize Wasp animation loader."""
-        super().__init__(json_path, scale, enemy_type="Wasp")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
-            
-    def load_wasp_animations(self) -> bool:
-        """Load all Wasp animations."""
-        return self.load_animations(self.WASP_ANIMATIONS)
-        
     def has_flight_abilities(self) -> bool:
         """Check if flight animations are available."""
-        return all(self.has_animation(anim) for anim in ['hover', 'fly', 'dive'])
+        return self.has_animations('hover', 'fly', 'dive')
+
+
+# Normalized enemy type names to loader classes
+_ENEMY_DISPATCH = {
+    'assassin': AssassinAnimationLoader,
+    'archer': ArcherAnimationLoader,
+    'wasp': WaspAnimationLoader,
+}
 
 
 # Factory function for creating appropriate enemy animation loaders
@@ -301,14 +301,11 @@ def create_enemy_loader(enemy_type: str, json_path: str, scale: int = 2) -> Enem
     Returns:
         Appropriate enemy animation loader instance
     """
-    enemy_type = enemy_type.lower()
-    
-    if enemy_type == 'assassin':
-        return AssassinAnimationLoader(json_path, scale)
-    elif enemy_type == 'archer':
-        return ArcherAnimationLoader(json_path, scale)
-    elif enemy_type == 'wasp':
-        return WaspAnimationLoader(json_path, scale)
-    else:
-        print(f"Warning: Unknown enemy type '{enemy_type}', using generic enemy loader")
-        return EnemyAnimationLoader(json_path, scale, enemy_type)
\ No newline at end of file
+    if not enemy_type.islower():
+        enemy_type = sys.intern(enemy_type.lower())
+    loader_class = _ENEMY_DISPATCH.get(enemy_type)
+    if loader_class is not None:
+        return loader_class(json_path, scale)
+        
+    logger.warning("Unknown enemy type '%s', using generic enemy loader", enemy_type)
+    return EnemyAnimationLoader(json_path, scale, enemy_type)
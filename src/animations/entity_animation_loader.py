@@ -11,8 +11,29 @@ It extends BaseAnimationLoader with entity-specific functionality such as:
 Entity loaders (Player, Enemy, etc.) inherit from this class.
 """
 
-from typing import Dict, List, Set, Optional
-from .base_animation_loader import BaseAnimationLoader
+import copy
+import logging
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import AbstractSet, Dict, List, Mapping, Set, Optional, Tuple
+from .base_animation_loader import BaseAnimationLoader, AnimationFrames
+
+logger = logging.getLogger(__name__)
+
+
+def _intern_anim_map(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Return a copy of a state-to-Aseprite mapping with interned keys and values."""
+    return {sys.intern(state): sys.intern(name) for state, name in mapping.items()}
+
+
+@dataclass(frozen=True)
+class AnimSchema:
+    """Required animations and fallback chains of a loader class, built once per class."""
+    __slots__ = ('required', 'fallbacks')
+    
+    required: frozenset
+    fallbacks: Mapping[str, Tuple[str, ...]]
 
 
 class EntityAnimationLoader(BaseAnimationLoader):
@@ -30,6 +51,36 @@ class EntityAnimationLoader(BaseAnimationLoader):
     - Animation state management utilities
     """
     
+    __slots__ = ('entity_type', 'required_animations', 'fallback_chains',
+                 '_resolved_fallbacks', '_lazy_animations', '_missing', '_capabilities')
+    
+    # Generic animations tried once an animation's own fallback chain is exhausted
+    COMMON_FALLBACKS = ('idle', 'walk', 'run')
+    
+    # Animations sliced on first use instead of at load time (overridden by entity types)
+    OPTIONAL_ANIMATIONS: Set[str] = set()
+    
+    # Declarative schema (overridden by entity types, applied by _apply_class_schema)
+    REQUIRED_ANIMATIONS: Tuple[str, ...] = ()
+    FALLBACK_CHAINS: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+    _SCHEMA = AnimSchema(required=frozenset(), fallbacks=MappingProxyType({}))
+    
+    def __init_subclass__(cls, **kwargs):
+        """Freeze the class schema once at class creation instead of per instance."""
+        super().__init_subclass__(**kwargs)
+        # Intern animation names so per-frame lookups hit the identity fast path,
+        # and expose the mappings read-only since they are shared class constants
+        for attr, value in list(vars(cls).items()):
+            if attr.endswith('ANIMATIONS') and isinstance(value, (dict, MappingProxyType)):
+                setattr(cls, attr, MappingProxyType(_intern_anim_map(value)))
+        cls._SCHEMA = AnimSchema(
+            required=frozenset(map(sys.intern, cls.REQUIRED_ANIMATIONS)),
+            fallbacks=MappingProxyType({
+                sys.intern(anim): tuple(map(sys.intern, fallbacks))
+                for anim, fallbacks in cls.FALLBACK_CHAINS.items()
+            }),
+        )
+        
     def __init__(self, json_path: str, scale: int = 2, entity_type: str = "generic"):
         """
         Initialize entity animation loader.
@@ -41,8 +92,31 @@ class EntityAnimationLoader(BaseAnimationLoader):
         """
         super().__init__(json_path, scale)
         self.entity_type = entity_type
-        self.required_animations: Set[str] = set()
-        self.fallback_chains: Dict[str, List[str]] = {}
+        self.required_animations: AbstractSet[str] = frozenset()
+        self.fallback_chains: Mapping[str, Tuple[str, ...]] = {}
+        self._resolved_fallbacks: Dict[str, Tuple[str, ...]] = {}
+        self._lazy_animations: Dict[str, str] = {}
+        self._missing: Optional[Set[str]] = None
+        self._capabilities: Dict[Tuple[str, ...], bool] = {}
+        
+    def _apply_class_schema(self):
+        """
+        Point this loader at its class schema.
+        
+        Both attributes reference the shared, read-only schema objects; the fallback
+        chains are only copied if set_fallback_chain customizes them later, and
+        missing required animations are only tracked once the loader is first used.
+        """
+        schema = type(self)._SCHEMA
+        self.required_animations = schema.required
+        self.fallback_chains = schema.fallbacks
+        self._missing = None
+        
+    def _track_missing(self) -> Set[str]:
+        """Get the outstanding required (or failed deferred) animations, starting to track them on first use."""
+        if self._missing is None:
+            self._missing = set(self.required_animations)
+        return self._missing
         
     def set_required_animations(self, required: List[str]):
         """
@@ -51,7 +125,8 @@ class EntityAnimationLoader(BaseAnimationLoader):
         Args:
             required: List of required animation names
         """
-        self.required_animations = set(required)
+        self.required_animations = frozenset(required)
+        self._missing = {name for name in self.required_animations if not self.has_animation(name)}
         
     def set_fallback_chain(self, animation: str, fallbacks: List[str]):
         """
@@ -64,9 +139,15 @@ class EntityAnimationLoader(BaseAnimationLoader):
             animation: Primary animation name
             fallbacks: List of fallback animation names to try in order
         """
-        self.fallback_chains[animation] = fallbacks
+        self._own_fallback_chains()[animation] = tuple(fallbacks)
+        
+    def _own_fallback_chains(self) -> Dict[str, Tuple[str, ...]]:
+        """Copy the shared schema fallback chains before this loader first modifies them."""
+        if isinstance(self.fallback_chains, MappingProxyType):
+            self.fallback_chains = dict(self.fallback_chains)
+        return self.fallback_chains
         
-    def load_animations(self, animation_mappings: Dict[str, str]) -> bool:
+    def load_animations(self, animation_mappings: Mapping[str, str]) -> bool:
         """
         Load animations based on a mapping from state names to Aseprite names.
         
@@ -80,22 +161,131 @@ class EntityAnimationLoader(BaseAnimationLoader):
         if not self.load():
             return False
             
+        self._capabilities.clear()
+        missing = self._track_missing()
         success_count = 0
         total_count = len(animation_mappings)
         
         # Load each animation
         for state_name, aseprite_name in animation_mappings.items():
+            # Defer optional animations (that the Aseprite data has) until they are first requested
+            if state_name in self.OPTIONAL_ANIMATIONS and aseprite_name in self.aseprite_loader.animations:
+                self._lazy_animations[state_name] = aseprite_name
+                missing.discard(state_name)
+                total_count -= 1
+                continue
+                
             if self._load_animation(state_name, aseprite_name):
+                missing.discard(state_name)
                 success_count += 1
             else:
-                print(f"{self.entity_type}: Failed to load animation '{state_name}' -> '{aseprite_name}'")
+                logger.warning("%s: Failed to load animation '%s' -> '%s'", self.entity_type, state_name, aseprite_name)
                 
         # Ensure required animations exist using fallback chains
+        self._finalize_fallbacks()
         self._ensure_required_animations()
         
-        print(f"{self.entity_type}: Loaded {success_count}/{total_count} animations")
+        logger.debug("%s: Loaded %d/%d animations (%d deferred)",
+                     self.entity_type, success_count, total_count, len(self._lazy_animations))
         return success_count > 0  # Success if at least one animation loaded
         
+    def defer_animations(self, animation_mappings: Mapping[str, str]) -> bool:
+        """
+        Register animations from the Aseprite data without building their surfaces yet.
+        
+        The JSON is parsed now, so the result reflects the real load, but each
+        animation's surfaces are only built when that animation is first requested.
+        
+        Args:
+            animation_mappings: Dict mapping game state names to Aseprite animation names
+            
+        Returns:
+            bool: True if the Aseprite data loaded and has at least one of the animations
+        """
+        self._capabilities.clear()
+        if not self.load():
+            return False
+            
+        available = self.aseprite_loader.animations
+        missing = self._track_missing()
+        deferred_count = 0
+        for state_name, aseprite_name in animation_mappings.items():
+            if aseprite_name in available:
+                self._lazy_animations[state_name] = aseprite_name
+                missing.discard(state_name)
+                deferred_count += 1
+                
+        self._finalize_fallbacks()
+        self._ensure_required_animations()
+        return deferred_count > 0
+        
+    def get_animation(self, name: str) -> Optional[AnimationFrames]:
+        """
+        Get animation data by name, loading a deferred optional animation on first use.
+        
+        Args:
+            name: Animation state name
+            
+        Returns:
+            AnimationFrames for the animation or None if not found
+        """
+        anim = self.animations.get(name)
+        if anim is None and name in self._lazy_animations:
+            aseprite_name = self._lazy_animations.pop(name)
+            if not self._load_animation(name, aseprite_name):
+                # Track the failure so has_animation and cached capabilities stop reporting it
+                self._track_missing().add(name)
+                self._capabilities.clear()
+                self._try_fallback_chain(name)
+            anim = self.animations.get(name)
+        return anim
+        
+    def has_animation(self, animation_name: str) -> bool:
+        """
+        Check if an animation exists (including deferred optional animations).
+        
+        Args:
+            animation_name: Name of the animation to check
+            
+        Returns:
+            True if animation exists or is waiting to be loaded, False otherwise
+        """
+        if animation_name in self.animations:
+            return True
+        missing = self._missing
+        return animation_name in self._lazy_animations and not (missing and animation_name in missing)
+        
+    def has_animations(self, *animation_names: str) -> bool:
+        """
+        Check whether all of the given animations exist, caching the answer.
+        
+        Capability checks (has_lock_system, has_transitions, ...) are polled from
+        update loops, so each combination is only resolved once per load.
+        
+        Args:
+            *animation_names: Names of the animations to check
+            
+        Returns:
+            True if every animation exists, False otherwise
+        """
+        cached = self._capabilities.get(animation_names)
+        if cached is None:
+            cached = all(self.has_animation(name) for name in animation_names)
+            self._capabilities[animation_names] = cached
+        return cached
+        
+    def _finalize_fallbacks(self):
+        """
+        Flatten each required animation's fallback chain into a single resolution order.
+        
+        The animation's own chain comes first, followed by the common fallbacks, so
+        resolving a missing animation is one scan over a precomputed list.
+        """
+        self._resolved_fallbacks = {
+            required: self.fallback_chains.get(required, ()) + self.COMMON_FALLBACKS
+            for required in self.required_animations
+        }
+        
     def _ensure_required_animations(self):
         """
         Ensure all required animations exist, using fallback chains if necessary.
@@ -111,24 +301,23 @@ class EntityAnimationLoader(BaseAnimationLoader):
         Args:
             animation_name: Name of the animation to create
         """
-        fallbacks = self.fallback_chains.get(animation_name, [])
-        
-        for fallback in fallbacks:
-            if self.has_animation(fallback):
+        candidates = self._resolved_fallbacks.get(animation_name)
+        if candidates is None:
+            candidates = self.fallback_chains.get(animation_name, ()) + self.COMMON_FALLBACKS
+            
+        for fallback in candidates:
+            # Deferred fallbacks are sliced on demand
+            fallback_anim = self.animations.get(fallback)
+            if fallback_anim is None and fallback in self._lazy_animations:
+                fallback_anim = self.get_animation(fallback)
+            if fallback_anim is not None:
                 # Copy the fallback animation
-                self.animations[animation_name] = self.animations[fallback].copy()
-                print(f"{self.entity_type}: Using '{fallback}' as fallback for '{animation_name}'")
+                self.animations[animation_name] = copy.copy(fallback_anim)
+                self._track_missing().discard(animation_name)
+                logger.debug("%s: Using '%s' as fallback for '%s'", self.entity_type, fallback, animation_name)
                 return
                 
-        # If no fallbacks worked, try common fallbacks
-        common_fallbacks = ['idle', 'walk', 'run']
-        for common in common_fallbacks:
-            if self.has_animation(common):
-                self.animations[animation_name] = self.animations[common].copy()
-                print(f"{self.entity_type}: Using '{common}' as common fallback for '{animation_name}'")
-                return
-                
-        print(f"{self.entity_type}: Warning - No fallback found for required animation '{animation_name}'")
+        logger.warning("%s: No fallback found for required animation '%s'", self.entity_type, animation_name)
         
     def validate_animations(self) -> bool:
         """
@@ -137,26 +326,27 @@ class EntityAnimationLoader(BaseAnimationLoader):
         Returns:
             bool: True if all required animations exist
         """
-        missing = []
-        for required in self.required_animations:
-            if not self.has_animation(required):
-                missing.append(required)
-                
+        # Only re-check names still outstanding (placeholders are added directly)
+        missing = self._track_missing()
         if missing:
-            print(f"{self.entity_type}: Missing required animations: {missing}")
+            self._missing = missing = {name for name in missing if not self.has_animation(name)}
+            
+        missing_required = missing.intersection(self.required_animations)
+        if missing_required:
+            logger.warning("%s: Missing required animations: %s", self.entity_type, sorted(missing_required))
             return False
             
-        print(f"{self.entity_type}: All required animations present")
+        logger.debug("%s: All required animations present", self.entity_type)
         return True
         
-    def get_animation_states(self) -> List[str]:
+    def get_animation_states(self) -> Tuple[str, ...]:
         """
         Get all available animation states for this entity.
         
         Returns:
-            List of animation state names
+            Tuple of animation state names
         """
-        return list(self.animations.keys())
+        return self.list_animations()
         
     def get_entity_info(self) -> Dict[str, any]:
         """
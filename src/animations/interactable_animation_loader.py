@@ -14,10 +14,28 @@ Interactable Types:
 Each interactable type has specific animation patterns and states.
 """
 
-from typing import Dict
-import pygame
+import functools
+import logging
+import sys
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+from .base_animation_loader import AnimationFrames, _make_placeholder
 from .entity_animation_loader import EntityAnimationLoader
 
+logger = logging.getLogger(__name__)
+
+# Type-name aliases accepted by create_interactable_loader
+_CHEST_ALIASES = frozenset({'chest'})
+_DOOR_ALIASES = frozenset({'door'})
+_COLLECTIBLE_ALIASES = frozenset({'collectible', 'item', 'pickup'})
+_SWITCH_ALIASES = frozenset({'switch', 'lever', 'button'})
+
+
+@functools.lru_cache(maxsize=8)
+def _interactable_pivot(scale: int) -> Tuple[int, int]:
+    """Interactable placeholder pivot point (bottom center) for a given scale."""
+    return (16 * scale, 31 * scale)
+
 
 class InteractableAnimationLoader(EntityAnimationLoader):
     """
@@ -35,7 +53,10 @@ class InteractableAnimationLoader(EntityAnimationLoader):
     - Minimal resource usage for background objects
     """
     
-    def __init__(self, json_path: str, scale: int = 2, interactable_type: str = "generic"):
+    __slots__ = ('interactable_type',)
+    
+    def __init__(self, json_path: str, scale: int = 2, interactable_type: str = "generic",
+                 entity_type: Optional[str] = None):
         """
         Initialize interactable animation loader.
         
@@ -43,9 +64,13 @@ class InteractableAnimationLoader(EntityAnimationLoader):
             json_path: Path to interactable Aseprite JSON file
             scale: Scale factor for rendering
             interactable_type: Specific type of interactable object
+            entity_type: Precomputed entity type label (defaults to 'Interactable-<type>')
         """
-        super().__init__(json_path, scale, entity_type=f"Interactable-{interactable_type}")
+        if entity_type is None:
+            entity_type = f"Interactable-{interactable_type}"
+        super().__init__(json_path, scale, entity_type=entity_type)
         self.interactable_type = interactable_type
+        self._apply_class_schema()
         
     def _create_fallback_animations(self):
         """
@@ -54,33 +79,27 @@ class InteractableAnimationLoader(EntityAnimationLoader):
         Creates simple placeholder animations for when Aseprite data fails to load.
         """
         # Create interactable-specific placeholder (green color for objects)
-        placeholder_size = (32 * self.scale, 32 * self.scale)
-        placeholder = pygame.Surface(placeholder_size, pygame.SRCALPHA)
-        placeholder.fill((80, 255, 80))  # Green color for interactables
-        
-        # Interactables typically don't need flipped versions, but include for consistency
-        flipped_placeholder = pygame.transform.flip(placeholder, True, False)
+        placeholder, flipped_placeholder = _make_placeholder(32 * self.scale, 32 * self.scale, (80, 255, 80))
         
         # Interactable pivot point (bottom center)
-        pivot_x = 16 * self.scale
-        pivot_y = 31 * self.scale
+        pivot = _interactable_pivot(self.scale)
         
-        placeholder_data = {
-            'surfaces_right': [placeholder],
-            'surfaces_left': [flipped_placeholder],
-            'pivots_right': [(pivot_x, pivot_y)],
-            'pivots_left': [(pivot_x, pivot_y)],
-            'durations': [0.5],  # Slow animations for ambient objects
-            'direction': 'forward',
-            'frame_count': 1
-        }
+        placeholder_data = AnimationFrames(
+            surfaces_right=[placeholder],
+            surfaces_left=[flipped_placeholder],
+            pivots_right=[pivot],
+            pivots_left=[pivot],
+            durations=[0.5],  # Slow animations for ambient objects
+            direction='forward',
+            frame_count=1
+        )
         
         # Create basic interactable animations
         basic_anims = ['idle', 'highlight', 'activate']
         for anim_name in basic_anims:
-            self.animations[anim_name] = placeholder_data.copy()
+            self.animations[anim_name] = placeholder_data  # read-only, shared by every name
             
-        print(f"Created {len(basic_anims)} interactable fallback animations")
+        logger.debug("Created %d interactable fallback animations", len(basic_anims))
 
 
 class ChestAnimationLoader(InteractableAnimationLoader):
@@ -97,6 +116,10 @@ class ChestAnimationLoader(InteractableAnimationLoader):
     - highlight: Visual feedback when player is nearby
     """
     
+    __slots__ = ()
+    
+    _ENTITY_TYPE = "Interactable-Chest"
+    
     CHEST_ANIMATIONS = {
         'idle': 'idle',         # Default closed state (1 frame)
         'opening': 'open',      # Opening transition animation (frames 1-34)  
@@ -105,24 +128,21 @@ class ChestAnimationLoader(InteractableAnimationLoader):
         'open': 'used',         # Alias for used state after opening
     }
     
-    REQUIRED_ANIMATIONS = ['idle', 'open', 'used']
+    REQUIRED_ANIMATIONS = ('idle', 'open', 'used')
     
-    FALLBACK_CHAINS = {
-        'opening': ['used', 'idle'],
-        'closed': ['idle'],
-        'open': ['used', 'idle'],
-    }
+    FALLBACK_CHAINS = MappingProxyType({
+        'opening': ('used', 'idle'),
+        'closed': ('idle',),
+        'open': ('used', 'idle'),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize chest animation loader."""
-        super().__init__(json_path, scale, interactable_type="Chest")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, interactable_type="Chest", entity_type=self._ENTITY_TYPE)
             
     def load_chest_animations(self) -> bool:
-        """Load all chest animations."""
-        return self.load_animations(self.CHEST_ANIMATIONS)
+        """Register all chest animations (sliced lazily on first use)."""
+        return self.defer_animations(self.CHEST_ANIMATIONS)
         
     def has_opening_animation(self) -> bool:
         """Check if opening transition animation is available."""
@@ -148,6 +168,10 @@ class DoorAnimationLoader(InteractableAnimationLoader):
     - unlocking: Transition from locked to unlocked
     """
     
+    __slots__ = ()
+    
+    _ENTITY_TYPE = "Interactable-Door"
+    
     DOOR_ANIMATIONS = {
         'closed': 'Closed',
         'opening': 'Opening',
@@ -158,30 +182,27 @@ class DoorAnimationLoader(InteractableAnimationLoader):
         'idle': 'Closed',
     }
     
-    REQUIRED_ANIMATIONS = ['closed', 'open']
+    REQUIRED_ANIMATIONS = ('closed', 'open')
     
-    FALLBACK_CHAINS = {
-        'opening': ['open', 'closed'],
-        'locked': ['closed'],
-        'unlocking': ['opening', 'closed'],
-        'highlight': ['closed'],
-        'idle': ['closed'],
-    }
+    FALLBACK_CHAINS = MappingProxyType({
+        'opening': ('open', 'closed'),
+        'locked': ('closed',),
+        'unlocking': ('opening', 'closed'),
+        'highlight': ('closed',),
+        'idle': ('closed',),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize door animation loader."""
-        super().__init__(json_path, scale, interactable_type="Door")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, interactable_type="Door", entity_type=self._ENTITY_TYPE)
             
     def load_door_animations(self) -> bool:
-        """Load all door animations."""
-        return self.load_animations(self.DOOR_ANIMATIONS)
+        """Register all door animations (sliced lazily on first use)."""
+        return self.defer_animations(self.DOOR_ANIMATIONS)
         
     def has_lock_system(self) -> bool:
         """Check if lock/unlock animations are available."""
-        return self.has_animation('locked') and self.has_animation('unlocking')
+        return self.has_animations('locked', 'unlocking')
 
 
 class CollectibleAnimationLoader(InteractableAnimationLoader):
@@ -198,6 +219,10 @@ class CollectibleAnimationLoader(InteractableAnimationLoader):
     - sparkle: Ambient particle-like effect
     """
     
+    __slots__ = ()
+    
+    _ENTITY_TYPE = "Interactable-Collectible"
+    
     COLLECTIBLE_ANIMATIONS = {
         'idle': 'Idle',
         'highlight': 'Highlight',
@@ -206,25 +231,22 @@ class CollectibleAnimationLoader(InteractableAnimationLoader):
         'glow': 'Glow',
     }
     
-    REQUIRED_ANIMATIONS = ['idle']
+    REQUIRED_ANIMATIONS = ('idle',)
     
-    FALLBACK_CHAINS = {
-        'highlight': ['idle'],
-        'collect': ['highlight', 'idle'],
-        'sparkle': ['idle'],
-        'glow': ['idle'],
-    }
+    FALLBACK_CHAINS = MappingProxyType({
+        'highlight': ('idle',),
+        'collect': ('highlight', 'idle'),
+        'sparkle': ('idle',),
+        'glow': ('idle',),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize collectible animation loader."""
-        super().__init__(json_path, scale, interactable_type="Collectible")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, interactable_type="Collectible", entity_type=self._ENTITY_TYPE)
             
     def load_collectible_animations(self) -> bool:
-        """Load all collectible animations."""
-        return self.load_animations(self.COLLECTIBLE_ANIMATIONS)
+        """Register all collectible animations (sliced lazily on first use)."""
+        return self.defer_animations(self.COLLECTIBLE_ANIMATIONS)
         
     def has_collection_effect(self) -> bool:
         """Check if collection animation is available."""
@@ -245,6 +267,10 @@ class SwitchAnimationLoader(InteractableAnimationLoader):
     - deactivating: Transition to off position
     """
     
+    __slots__ = ()
+    
+    _ENTITY_TYPE = "Interactable-Switch"
+    
     SWITCH_ANIMATIONS = {
         'off': 'Off',
         'activating': 'Activating',
@@ -254,29 +280,35 @@ class SwitchAnimationLoader(InteractableAnimationLoader):
         'idle': 'Off',  # Default to off state
     }
     
-    REQUIRED_ANIMATIONS = ['off', 'on']
+    REQUIRED_ANIMATIONS = ('off', 'on')
     
-    FALLBACK_CHAINS = {
-        'activating': ['on', 'off'],
-        'deactivating': ['off', 'on'],
-        'highlight': ['off'],
-        'idle': ['off'],
-    }
+    FALLBACK_CHAINS = MappingProxyType({
+        'activating': ('on', 'off'),
+        'deactivating': ('off', 'on'),
+        'highlight': ('off',),
+        'idle': ('off',),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize switch animation loader."""
-        super().__init__(json_path, scale, interactable_type="Switch")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, interactable_type="Switch", entity_type=self._ENTITY_TYPE)
             
     def load_switch_animations(self) -> bool:
-        """Load all switch animations."""
-        return self.load_animations(self.SWITCH_ANIMATIONS)
+        """Register all switch animations (sliced lazily on first use)."""
+        return self.defer_animations(self.SWITCH_ANIMATIONS)
         
     def has_transitions(self) -> bool:
         """Check if transition animations are available."""
-        return self.has_animation('activating') and self.has_animation('deactivating')
+        return self.has_animations('activating', 'deactivating')
+
+
+# Normalized interactable type names (including aliases) to loader classes
+_INTERACTABLE_DISPATCH = {
+    **dict.fromkeys(_CHEST_ALIASES, ChestAnimationLoader),
+    **dict.fromkeys(_DOOR_ALIASES, DoorAnimationLoader),
+    **dict.fromkeys(_COLLECTIBLE_ALIASES, CollectibleAnimationLoader),
+    **dict.fromkeys(_SWITCH_ALIASES, SwitchAnimationLoader),
+}
 
 
 # Factory function for creating appropriate interactable animation loaders
@@ -292,16 +324,11 @@ def create_interactable_loader(interactable_type: str, json_path: str, scale: in
     Returns:
         Appropriate interactable animation loader instance
     """
-    interactable_type = interactable_type.lower()
-    
-    if interactable_type == 'chest':
-        return ChestAnimationLoader(json_path, scale)
-    elif interactable_type == 'door':
-        return DoorAnimationLoader(json_path, scale)
-    elif interactable_type in ['collectible', 'item', 'pickup']:
-        return CollectibleAnimationLoader(json_path, scale)
-    elif interactable_type in ['switch', 'lever', 'button']:
-        return SwitchAnimationLoader(json_path, scale)
-    else:
-        print(f"Warning: Unknown interactable type '{interactable_type}', using generic loader")
-        return InteractableAnimationLoader(json_path, scale, interactable_type)
\ No newline at end of file
+    if not interactable_type.islower():
+        interactable_type = sys.intern(interactable_type.lower())
+    loader_class = _INTERACTABLE_DISPATCH.get(interactable_type)
+    if loader_class is not None:
+        return loader_class(json_path, scale)
+        
+    logger.warning("Unknown interactable type '%s', using generic loader", interactable_type)
+    return InteractableAnimationLoader(json_path, scale, interactable_type)
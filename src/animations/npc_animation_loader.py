@@ -14,10 +14,28 @@ NPC Types:
 Each NPC type has specific animation patterns for their role.
 """
 
-from typing import Dict
-import pygame
+import functools
+import logging
+import sys
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+from .base_animation_loader import AnimationFrames, _make_placeholder
 from .entity_animation_loader import EntityAnimationLoader
 
+logger = logging.getLogger(__name__)
+
+# Type-name aliases accepted by create_npc_loader
+_DIALOGUE_ALIASES = frozenset({'dialogue', 'talk', 'conversation'})
+_SHOP_ALIASES = frozenset({'shop', 'merchant', 'vendor'})
+_QUEST_ALIASES = frozenset({'quest', 'mission', 'story'})
+_AMBIENT_ALIASES = frozenset({'ambient', 'background', 'atmosphere'})
+
+
+@functools.lru_cache(maxsize=8)
+def _npc_pivot(scale: int) -> Tuple[int, int]:
+    """NPC placeholder pivot point (bottom center) for a given scale."""
+    return (25 * scale, 49 * scale)
+
 
 class NPCAnimationLoader(EntityAnimationLoader):
     """
@@ -36,7 +54,10 @@ class NPCAnimationLoader(EntityAnimationLoader):
     - Ambient behavior animations
     """
     
-    def __init__(self, json_path: str, scale: int = 2, npc_type: str = "generic"):
+    __slots__ = ('npc_type',)
+    
+    def __init__(self, json_path: str, scale: int = 2, npc_type: str = "generic",
+                 entity_type: Optional[str] = None):
         """
         Initialize NPC animation loader.
         
@@ -44,9 +65,13 @@ class NPCAnimationLoader(EntityAnimationLoader):
             json_path: Path to NPC Aseprite JSON file
             scale: Scale factor for rendering
             npc_type: Specific type of NPC
+            entity_type: Precomputed entity type label (defaults to 'NPC-<type>')
         """
-        super().__init__(json_path, scale, entity_type=f"NPC-{npc_type}")
+        if entity_type is None:
+            entity_type = f"NPC-{npc_type}"
+        super().__init__(json_path, scale, entity_type=entity_type)
         self.npc_type = npc_type
+        self._apply_class_schema()
         
     def _create_fallback_animations(self):
         """
@@ -55,32 +80,27 @@ class NPCAnimationLoader(EntityAnimationLoader):
         Creates friendly placeholder animations for when Aseprite data fails to load.
         """
         # Create NPC-specific placeholder (yellow color for friendly NPCs)
-        placeholder_size = (50 * self.scale, 50 * self.scale)
-        placeholder = pygame.Surface(placeholder_size, pygame.SRCALPHA)
-        placeholder.fill((255, 255, 80))  # Yellow color for NPCs
-        
-        flipped_placeholder = pygame.transform.flip(placeholder, True, False)
+        placeholder, flipped_placeholder = _make_placeholder(50 * self.scale, 50 * self.scale, (255, 255, 80))
         
         # NPC pivot point (bottom center)
-        pivot_x = 25 * self.scale
-        pivot_y = 49 * self.scale
+        pivot = _npc_pivot(self.scale)
         
-        placeholder_data = {
-            'surfaces_right': [placeholder],
-            'surfaces_left': [flipped_placeholder],
-            'pivots_right': [(pivot_x, pivot_y)],
-            'pivots_left': [(pivot_x, pivot_y)],
-            'durations': [0.2],  # Moderate pace for NPCs
-            'direction': 'forward',
-            'frame_count': 1
-        }
+        placeholder_data = AnimationFrames(
+            surfaces_right=[placeholder],
+            surfaces_left=[flipped_placeholder],
+            pivots_right=[pivot],
+            pivots_left=[pivot],
+            durations=[0.2],  # Moderate pace for NPCs
+            direction='forward',
+            frame_count=1
+        )
         
         # Create basic NPC animations
         basic_npc_anims = ['idle', 'talk', 'wave', 'nod']
         for anim_name in basic_npc_anims:
-            self.animations[anim_name] = placeholder_data.copy()
+            self.animations[anim_name] = placeholder_data  # read-only, shared by every name
             
-        print(f"Created {len(basic_npc_anims)} NPC fallback animations")
+        logger.debug("Created %d NPC fallback animations", len(basic_npc_anims))
 
 
 class DialogueNPCLoader(NPCAnimationLoader):
@@ -101,6 +121,10 @@ class DialogueNPCLoader(NPCAnimationLoader):
     - think: Contemplative pose
     """
     
+    __slots__ = ('_conversation_anims',)
+    
+    _ENTITY_TYPE = "NPC-Dialogue"
+    
     DIALOGUE_ANIMATIONS = {
         'idle': 'Idle',
         'talk': 'Talk',
@@ -113,38 +137,39 @@ class DialogueNPCLoader(NPCAnimationLoader):
         'wave': 'Wave',
     }
     
-    REQUIRED_ANIMATIONS = ['idle', 'talk']
-    
-    FALLBACK_CHAINS = {
-        'talk': ['idle'],
-        'listen': ['idle'],
-        'greet': ['wave', 'idle'],
-        'goodbye': ['wave', 'idle'],
-        'nod': ['idle'],
-        'shake_head': ['nod', 'idle'],
-        'think': ['idle'],
-        'wave': ['idle'],
-    }
+    REQUIRED_ANIMATIONS = ('idle', 'talk')
+    
+    FALLBACK_CHAINS = MappingProxyType({
+        'talk': ('idle',),
+        'listen': ('idle',),
+        'greet': ('wave', 'idle'),
+        'goodbye': ('wave', 'idle'),
+        'nod': ('idle',),
+        'shake_head': ('nod', 'idle'),
+        'think': ('idle',),
+        'wave': ('idle',),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize dialogue NPC animation loader."""
-        super().__init__(json_path, scale, npc_type="Dialogue")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, npc_type="Dialogue", entity_type=self._ENTITY_TYPE)
+        self._conversation_anims: Optional[Dict[str, AnimationFrames]] = None
             
     def load_dialogue_animations(self) -> bool:
-        """Load all dialogue NPC animations."""
-        return self.load_animations(self.DIALOGUE_ANIMATIONS)
+        """Register all dialogue NPC animations (sliced lazily on first use)."""
+        self._conversation_anims = None
+        return self.defer_animations(self.DIALOGUE_ANIMATIONS)
         
     def has_expression_animations(self) -> bool:
         """Check if expression animations are available."""
-        return self.has_animation('nod') and self.has_animation('shake_head')
+        return self.has_animations('nod', 'shake_head')
         
-    def get_conversation_animations(self) -> Dict[str, Dict]:
-        """Get animations used during conversations."""
-        conv_anims = ['talk', 'listen', 'nod', 'shake_head', 'think']
-        return {name: self.get_animation(name) for name in conv_anims if self.has_animation(name)}
+    def get_conversation_animations(self) -> Dict[str, AnimationFrames]:
+        """Get animations used during conversations (built once, then cached)."""
+        if self._conversation_anims is None:
+            conv_anims = ['talk', 'listen', 'nod', 'shake_head', 'think']
+            self._conversation_anims = {name: self.get_animation(name) for name in conv_anims if self.has_animation(name)}
+        return self._conversation_anims
 
 
 class ShopNPCLoader(NPCAnimationLoader):
@@ -164,6 +189,10 @@ class ShopNPCLoader(NPCAnimationLoader):
     - busy: Working on shop tasks
     """
     
+    __slots__ = ()
+    
+    _ENTITY_TYPE = "NPC-Shop"
+    
     SHOP_ANIMATIONS = {
         'idle': 'Idle',
         'greet': 'Greet',
@@ -175,32 +204,29 @@ class ShopNPCLoader(NPCAnimationLoader):
         'talk': 'Talk',
     }
     
-    REQUIRED_ANIMATIONS = ['idle', 'greet']
+    REQUIRED_ANIMATIONS = ('idle', 'greet')
     
-    FALLBACK_CHAINS = {
-        'greet': ['wave', 'idle'],
-        'show_item': ['idle'],
-        'count_money': ['busy', 'idle'],
-        'package': ['busy', 'idle'],
-        'wave': ['idle'],
-        'busy': ['idle'],
-        'talk': ['idle'],
-    }
+    FALLBACK_CHAINS = MappingProxyType({
+        'greet': ('wave', 'idle'),
+        'show_item': ('idle',),
+        'count_money': ('busy', 'idle'),
+        'package': ('busy', 'idle'),
+        'wave': ('idle',),
+        'busy': ('idle',),
+        'talk': ('idle',),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize shop NPC animation loader."""
-        super().__init__(json_path, scale, npc_type="Shop")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, npc_type="Shop", entity_type=self._ENTITY_TYPE)
             
     def load_shop_animations(self) -> bool:
-        """Load all shop NPC animations."""
-        return self.load_animations(self.SHOP_ANIMATIONS)
+        """Register all shop NPC animations (sliced lazily on first use)."""
+        return self.defer_animations(self.SHOP_ANIMATIONS)
         
     def has_transaction_animations(self) -> bool:
         """Check if transaction animations are available."""
-        return self.has_animation('show_item') and self.has_animation('count_money')
+        return self.has_animations('show_item', 'count_money')
 
 
 class QuestNPCLoader(NPCAnimationLoader):
@@ -220,6 +246,10 @@ class QuestNPCLoader(NPCAnimationLoader):
     - thank: Gratitude gesture for quest completion
     """
     
+    __slots__ = ()
+    
+    _ENTITY_TYPE = "NPC-Quest"
+    
     QUEST_ANIMATIONS = {
         'idle': 'Idle',
         'urgent': 'Urgent',
@@ -232,33 +262,30 @@ class QuestNPCLoader(NPCAnimationLoader):
         'greet': 'Greet',
     }
     
-    REQUIRED_ANIMATIONS = ['idle', 'talk']
-    
-    FALLBACK_CHAINS = {
-        'urgent': ['talk', 'idle'],
-        'point': ['idle'],
-        'explain': ['talk', 'idle'],
-        'worry': ['idle'],
-        'relief': ['idle'],
-        'thank': ['greet', 'idle'],
-        'talk': ['idle'],
-        'greet': ['idle'],
-    }
+    REQUIRED_ANIMATIONS = ('idle', 'talk')
+    
+    FALLBACK_CHAINS = MappingProxyType({
+        'urgent': ('talk', 'idle'),
+        'point': ('idle',),
+        'explain': ('talk', 'idle'),
+        'worry': ('idle',),
+        'relief': ('idle',),
+        'thank': ('greet', 'idle'),
+        'talk': ('idle',),
+        'greet': ('idle',),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize quest NPC animation loader."""
-        super().__init__(json_path, scale, npc_type="Quest")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, npc_type="Quest", entity_type=self._ENTITY_TYPE)
             
     def load_quest_animations(self) -> bool:
-        """Load all quest NPC animations."""
-        return self.load_animations(self.QUEST_ANIMATIONS)
+        """Register all quest NPC animations (sliced lazily on first use)."""
+        return self.defer_animations(self.QUEST_ANIMATIONS)
         
     def has_emotional_range(self) -> bool:
         """Check if emotional animations are available."""
-        return self.has_animation('worry') and self.has_animation('relief')
+        return self.has_animations('worry', 'relief')
 
 
 class AmbientNPCLoader(NPCAnimationLoader):
@@ -277,6 +304,10 @@ class AmbientNPCLoader(NPCAnimationLoader):
     - read: Reading or studying
     """
     
+    __slots__ = ('_background_anims',)
+    
+    _ENTITY_TYPE = "NPC-Ambient"
+    
     AMBIENT_ANIMATIONS = {
         'idle': 'Idle',
         'work': 'Work',
@@ -287,32 +318,42 @@ class AmbientNPCLoader(NPCAnimationLoader):
         'look_around': 'Look Around',
     }
     
-    REQUIRED_ANIMATIONS = ['idle']
+    REQUIRED_ANIMATIONS = ('idle',)
     
-    FALLBACK_CHAINS = {
-        'work': ['idle'],
-        'walk': ['idle'],
-        'sit': ['idle'],
-        'sleep': ['idle'],
-        'read': ['sit', 'idle'],
-        'look_around': ['idle'],
-    }
+    FALLBACK_CHAINS = MappingProxyType({
+        'work': ('idle',),
+        'walk': ('idle',),
+        'sit': ('idle',),
+        'sleep': ('idle',),
+        'read': ('sit', 'idle'),
+        'look_around': ('idle',),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """Initialize ambient NPC animation loader."""
-        super().__init__(json_path, scale, npc_type="Ambient")
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        super().__init__(json_path, scale, npc_type="Ambient", entity_type=self._ENTITY_TYPE)
+        self._background_anims: Optional[Dict[str, AnimationFrames]] = None
             
     def load_ambient_animations(self) -> bool:
-        """Load all ambient NPC animations."""
-        return self.load_animations(self.AMBIENT_ANIMATIONS)
+        """Register all ambient NPC animations (sliced lazily on first use)."""
+        self._background_anims = None
+        return self.defer_animations(self.AMBIENT_ANIMATIONS)
         
-    def get_background_animations(self) -> Dict[str, Dict]:
-        """Get animations suitable for background behavior."""
-        bg_anims = ['idle', 'work', 'sit', 'read', 'look_around']
-        return {name: self.get_animation(name) for name in bg_anims if self.has_animation(name)}
+    def get_background_animations(self) -> Dict[str, AnimationFrames]:
+        """Get animations suitable for background behavior (built once, then cached)."""
+        if self._background_anims is None:
+            bg_anims = ['idle', 'work', 'sit', 'read', 'look_around']
+            self._background_anims = {name: self.get_animation(name) for name in bg_anims if self.has_animation(name)}
+        return self._background_anims
+
+
+# Normalized NPC type names (including aliases) to loader classes
+_NPC_DISPATCH = {
+    **dict.fromkeys(_DIALOGUE_ALIASES, DialogueNPCLoader),
+    **dict.fromkeys(_SHOP_ALIASES, ShopNPCLoader),
+    **dict.fromkeys(_QUEST_ALIASES, QuestNPCLoader),
+    **dict.fromkeys(_AMBIENT_ALIASES, AmbientNPCLoader),
+}
 
 
 # Factory function for creating appropriate NPC animation loaders
@@ -328,16 +369,11 @@ def create_npc_loader(npc_type: str, json_path: str, scale: int = 2) -> NPCAnima
     Returns:
         Appropriate NPC animation loader instance
     """
-    npc_type = npc_type.lower()
-    
-    if npc_type in ['dialogue', 'talk', 'conversation']:
-        return DialogueNPCLoader(json_path, scale)
-    elif npc_type in ['shop', 'merchant', 'vendor']:
-        return ShopNPCLoader(json_path, scale)
-    elif npc_type in ['quest', 'mission', 'story']:
-        return QuestNPCLoader(json_path, scale)
-    elif npc_type in ['ambient', 'background', 'atmosphere']:
-        return AmbientNPCLoader(json_path, scale)
-    else:
-        print(f"Warning: Unknown NPC type '{npc_type}', using generic NPC loader")
-        return NPCAnimationLoader(json_path, scale, npc_type)
\ No newline at end of file
+    if not npc_type.islower():
+        npc_type = sys.intern(npc_type.lower())
+    loader_class = _NPC_DISPATCH.get(npc_type)
+    if loader_class is not None:
+        return loader_class(json_path, scale)
+        
+    logger.warning("Unknown NPC type '%s', using generic NPC loader", npc_type)
+    return NPCAnimationLoader(json_path, scale, npc_type)
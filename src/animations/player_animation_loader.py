@@ -15,10 +15,15 @@ Each animation is mapped to its corresponding Aseprite animation name and includ
 appropriate fallback chains for robustness.
 """
 
-from typing import Dict
-import pygame
+import logging
+import weakref
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+from .base_animation_loader import AnimationFrames, _make_placeholder
 from .entity_animation_loader import EntityAnimationLoader
 
+logger = logging.getLogger(__name__)
+
 
 class PlayerAnimationLoader(EntityAnimationLoader):
     """
@@ -36,6 +41,25 @@ class PlayerAnimationLoader(EntityAnimationLoader):
     - Robust fallback chains for missing animations
     """
     
+    __slots__ = ('_category_cache', '_ability_mask', '_anim_table')
+    
+    # Animation groups returned by the get_*_animations helpers
+    _COMBAT_NAMES = ('attack1', 'attack2', 'roll', 'fall_attack', 'slam_attack')
+    _MOVEMENT_NAMES = ('idle', 'walk', 'jump', 'fall', 'trans', 'dash')
+    _WALL_NAMES = ('wall_hold', 'wall_transition', 'wall_slide', 'wall_slide_stop', 'ledge_grab')
+    _HEALTH_NAMES = ('spawn', 'hit', 'death')
+    
+    # Ability animations packed into a bitmask at load time
+    _ABILITY_BITS = {
+        'roll': 1, 'fall_attack': 2, 'slam_attack': 4,
+        'wall_hold': 8, 'wall_slide': 16, 'ledge_grab': 32,
+    }
+    _COMBAT_MASK = 1 | 2 | 4
+    _WALL_MASK = 8 | 16 | 32
+    
+    # Placeholder animation per scale, shared by every player loader that needs one
+    _placeholder_cache: "weakref.WeakValueDictionary[int, AnimationFrames]" = weakref.WeakValueDictionary()
+    
     # Player animation mappings from game states to Aseprite animation names
     PLAYER_ANIMATIONS = {
         # Basic Movement
@@ -70,39 +94,42 @@ class PlayerAnimationLoader(EntityAnimationLoader):
         'slam_attack': 'Slam',
     }
     
+    # Small integer ID per animation state, for hot paths that index _anim_table
+    ANIMATION_IDS = MappingProxyType({name: anim_id for anim_id, name in enumerate(PLAYER_ANIMATIONS)})
+    
     # Required animations that the player must have to function properly
-    REQUIRED_ANIMATIONS = [
+    REQUIRED_ANIMATIONS = (
         'idle', 'walk', 'jump', 'fall',  # Basic movement
         'attack1', 'spawn', 'hit', 'death'  # Essential states
-    ]
+    )
     
     # Fallback chains for missing animations
-    FALLBACK_CHAINS = {
+    FALLBACK_CHAINS = MappingProxyType({
         # Movement fallbacks
-        'walk': ['idle'],
-        'jump': ['idle'],
-        'trans': ['walk', 'idle'],
-        'fall': ['jump', 'idle'],
-        'dash': ['walk', 'idle'],
+        'walk': ('idle',),
+        'jump': ('idle',),
+        'trans': ('walk', 'idle'),
+        'fall': ('jump', 'idle'),
+        'dash': ('walk', 'idle'),
         
         # Combat fallbacks
-        'attack2': ['attack1'],
-        'roll': ['dash', 'walk'],
-        'fall_attack': ['attack1', 'fall'],
-        'slam_attack': ['attack1'],
+        'attack2': ('attack1',),
+        'roll': ('dash', 'walk'),
+        'fall_attack': ('attack1', 'fall'),
+        'slam_attack': ('attack1',),
         
         # Health state fallbacks
-        'hit': ['idle'],
-        'death': ['hit', 'idle'],
-        'spawn': ['idle'],
+        'hit': ('idle',),
+        'death': ('hit', 'idle'),
+        'spawn': ('idle',),
         
         # Advanced movement fallbacks
-        'ledge_grab': ['idle'],
-        'wall_hold': ['idle'],
-        'wall_transition': ['wall_hold', 'idle'],
-        'wall_slide': ['wall_transition', 'fall', 'idle'],
-        'wall_slide_stop': ['wall_slide', 'idle'],
-    }
+        'ledge_grab': ('idle',),
+        'wall_hold': ('idle',),
+        'wall_transition': ('wall_hold', 'idle'),
+        'wall_slide': ('wall_transition', 'fall', 'idle'),
+        'wall_slide_stop': ('wall_slide', 'idle'),
+    })
     
     def __init__(self, json_path: str, scale: int = 2):
         """
@@ -114,12 +141,11 @@ class PlayerAnimationLoader(EntityAnimationLoader):
         """
         super().__init__(json_path, scale, entity_type="Player")
         
-        # Set up player-specific configuration
-        self.set_required_animations(self.REQUIRED_ANIMATIONS)
-        
-        # Set up fallback chains
-        for anim, fallbacks in self.FALLBACK_CHAINS.items():
-            self.set_fallback_chain(anim, fallbacks)
+        # Set up player-specific configuration and fallback chains
+        self._apply_class_schema()
+        self._category_cache: Dict[Tuple[str, ...], Dict[str, AnimationFrames]] = {}
+        self._ability_mask = 0
+        self._anim_table: List[Optional[AnimationFrames]] = [None] * len(self.ANIMATION_IDS)
             
     def load_player_animations(self) -> bool:
         """
@@ -129,19 +155,24 @@ class PlayerAnimationLoader(EntityAnimationLoader):
             bool: True if player animations were loaded successfully
         """
         success = self.load_animations(self.PLAYER_ANIMATIONS)
+        self._category_cache.clear()
+        
+        ability_mask = 0
+        for name, bit in self._ABILITY_BITS.items():
+            if self.has_animation(name):
+                ability_mask |= bit
+        self._ability_mask = ability_mask
+        
+        # Flat table indexed by ANIMATION_IDS, with fallback chains already resolved
+        self._anim_table = [self.resolve_animation(name) for name in self.ANIMATION_IDS]
         
         if success:
-            print(f"Player animation system loaded successfully:")
-            print(f"  - {len(self.animations)} animations loaded")
-            print(f"  - Pivot point: {self.pivot_point}")
-            print(f"  - Scale: {self.scale}x")
+            logger.debug("Player animation system loaded: %d animations, pivot %s, scale %dx",
+                         len(self.animations), self.pivot_point, self.scale)
+            
+            # Validate required animations (logs any missing ones)
+            self.validate_animations()
             
-            # Validate that we have all required animations
-            if self.validate_animations():
-                print("  - All required animations validated ✓")
-            else:
-                print("  - Some required animations missing ⚠")
-                
         return success
         
     def _create_fallback_animations(self):
@@ -150,72 +181,108 @@ class PlayerAnimationLoader(EntityAnimationLoader):
         
         Creates a basic player sprite placeholder when Aseprite data fails to load.
         """
-        # Create player-specific placeholder (blue color for player)
-        placeholder_size = (60 * self.scale, 60 * self.scale)
-        placeholder = pygame.Surface(placeholder_size, pygame.SRCALPHA)
-        placeholder.fill((80, 150, 255))  # Blue color for player
-        
-        flipped_placeholder = pygame.transform.flip(placeholder, True, False)
-        
-        # Player-specific pivot point (bottom center)
-        pivot_x = 30 * self.scale
-        pivot_y = 59 * self.scale
-        
-        placeholder_data = {
-            'surfaces_right': [placeholder],
-            'surfaces_left': [flipped_placeholder],
-            'pivots_right': [(pivot_x, pivot_y)],
-            'pivots_left': [(pivot_x, pivot_y)],
-            'durations': [0.1],
-            'direction': 'forward',
-            'frame_count': 1
-        }
+        placeholder_data = PlayerAnimationLoader._placeholder_cache.get(self.scale)
+        if placeholder_data is None:
+            # Create player-specific placeholder (blue color for player)
+            placeholder, flipped_placeholder = _make_placeholder(60 * self.scale, 60 * self.scale, (80, 150, 255))
+            
+            # Player-specific pivot point (bottom center)
+            pivot_x = 30 * self.scale
+            pivot_y = 59 * self.scale
+            
+            placeholder_data = AnimationFrames(
+                surfaces_right=[placeholder],
+                surfaces_left=[flipped_placeholder],
+                pivots_right=[(pivot_x, pivot_y)],
+                pivots_left=[(pivot_x, pivot_y)],
+                durations=[0.1],
+                direction='forward',
+                frame_count=1
+            )
+            PlayerAnimationLoader._placeholder_cache[self.scale] = placeholder_data
         
         # Create all required player animations as fallbacks
         for anim_name in self.REQUIRED_ANIMATIONS:
-            self.animations[anim_name] = placeholder_data.copy()
+            self.animations[anim_name] = placeholder_data  # read-only, shared by every name
             
-        print(f"Created {len(self.REQUIRED_ANIMATIONS)} player fallback animations")
+        logger.debug("Created %d player fallback animations", len(self.REQUIRED_ANIMATIONS))
+        
+    def resolve_animation(self, name: str) -> Optional[AnimationFrames]:
+        """
+        Get an animation's data, or that of the first available animation in its fallback chain.
+        
+        Unlike get_animation, which only returns the exact animation, this never
+        reports a missing animation whose fallback exists.
+        
+        Args:
+            name: Animation state name
+            
+        Returns:
+            AnimationFrames for the animation (or its fallback) or None if neither is available
+        """
+        anim = self.get_animation(name)
+        if anim is None:
+            for fallback in self.fallback_chains.get(name, ()):
+                anim = self.get_animation(fallback)
+                if anim is not None:
+                    break
+        return anim
+        
+    def get_animation_by_id(self, anim_id: int) -> Optional[AnimationFrames]:
+        """
+        Get animation data by its ANIMATION_IDS index, with fallback chains resolved.
+        
+        Args:
+            anim_id: Animation ID from ANIMATION_IDS
+            
+        Returns:
+            AnimationFrames for the animation or None if not available
+        """
+        return self._anim_table[anim_id]
+        
+    def _get_category(self, names: Tuple[str, ...]) -> Dict[str, AnimationFrames]:
+        """Build (once per load) the dict of available animations among names."""
+        category = self._category_cache.get(names)
+        if category is None:
+            category = {name: self.get_animation(name) for name in names if self.has_animation(name)}
+            self._category_cache[names] = category
+        return category
         
-    def get_combat_animations(self) -> Dict[str, Dict]:
+    def get_combat_animations(self) -> Dict[str, AnimationFrames]:
         """
         Get all combat-related animations.
         
         Returns:
             Dictionary of combat animations
         """
-        combat_anims = ['attack1', 'attack2', 'roll', 'fall_attack', 'slam_attack']
-        return {name: self.get_animation(name) for name in combat_anims if self.has_animation(name)}
+        return self._get_category(self._COMBAT_NAMES)
         
-    def get_movement_animations(self) -> Dict[str, Dict]:
+    def get_movement_animations(self) -> Dict[str, AnimationFrames]:
         """
         Get all movement-related animations.
         
         Returns:
             Dictionary of movement animations
         """
-        movement_anims = ['idle', 'walk', 'jump', 'fall', 'trans', 'dash']
-        return {name: self.get_animation(name) for name in movement_anims if self.has_animation(name)}
+        return self._get_category(self._MOVEMENT_NAMES)
         
-    def get_wall_animations(self) -> Dict[str, Dict]:
+    def get_wall_animations(self) -> Dict[str, AnimationFrames]:
         """
         Get all wall climbing related animations.
         
         Returns:
             Dictionary of wall animations
         """
-        wall_anims = ['wall_hold', 'wall_transition', 'wall_slide', 'wall_slide_stop', 'ledge_grab']
-        return {name: self.get_animation(name) for name in wall_anims if self.has_animation(name)}
+        return self._get_category(self._WALL_NAMES)
         
-    def get_health_animations(self) -> Dict[str, Dict]:
+    def get_health_animations(self) -> Dict[str, AnimationFrames]:
         """
         Get all health state related animations.
         
         Returns:
             Dictionary of health state animations
         """
-        health_anims = ['spawn', 'hit', 'death']
-        return {name: self.get_animation(name) for name in health_anims if self.has_animation(name)}
+        return self._get_category(self._HEALTH_NAMES)
         
     def has_combat_abilities(self) -> bool:
         """
@@ -224,7 +291,7 @@ class PlayerAnimationLoader(EntityAnimationLoader):
         Returns:
             bool: True if roll, fall_attack, and slam_attack are available
         """
-        return all(self.has_animation(anim) for anim in ['roll', 'fall_attack', 'slam_attack'])
+        return self._ability_mask & self._COMBAT_MASK == self._COMBAT_MASK
         
     def has_wall_abilities(self) -> bool:
         """
@@ -233,7 +300,7 @@ class PlayerAnimationLoader(EntityAnimationLoader):
         Returns:
             bool: True if wall climbing animations are available
         """
-        return all(self.has_animation(anim) for anim in ['wall_hold', 'wall_slide', 'ledge_grab'])
+        return self._ability_mask & self._WALL_MASK == self._WALL_MASK
         
     def get_player_info(self) -> Dict[str, any]:
         """
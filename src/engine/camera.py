@@ -1,25 +1,43 @@
 """Camera system for following the player and managing viewport."""
+import math
 import pygame
-from typing import Tuple
+from typing import Dict, Iterable, List, Tuple
 
 
 class Camera:
     """Camera system for smooth following and viewport management."""
     
+    __slots__ = ('width', 'height', '_half_w', '_half_h', 'x', 'y', '_ix', '_iy',
+                 '_viewport', '_vis_right', '_vis_bottom',
+                 'lerp_speed', '_alpha_lut', 'target_x', 'target_y',
+                 'dead_zone_width', 'dead_zone_height', '_dead_zone_hw', '_dead_zone_hh',
+                 'lookahead_distance', 'lookahead_smooth',
+                 'world_width', 'world_height', '_max_x', '_max_y')
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
+        self._half_w = width // 2
+        self._half_h = height // 2
         self.x = 0.0
         self.y = 0.0
+        self._ix = 0  # Pixel-snapped position, updated once per position change
+        self._iy = 0
+        self._viewport = pygame.Rect(0, 0, width, height)
+        self._vis_right = float(width)
+        self._vis_bottom = float(height)
         
         # Camera smoothing - using lerp factor instead of smoothing
         self.lerp_speed = 8.0  # How fast camera catches up (higher = faster)
+        self._alpha_lut = self._build_alpha_lut(self.lerp_speed)
         self.target_x = 0.0
         self.target_y = 0.0
         
         # Dead zone (area where player can move without camera moving)
         self.dead_zone_width = 10  # Smaller dead zone for more responsive feel
         self.dead_zone_height = 10
+        self._dead_zone_hw = self.dead_zone_width // 2
+        self._dead_zone_hh = self.dead_zone_height // 2
         
         # Lookahead - camera anticipates player movement
         self.lookahead_distance = 50
@@ -28,89 +46,140 @@ class Camera:
         # World bounds (set by world)
         self.world_width = 0
         self.world_height = 0
+        self._max_x = 0
+        self._max_y = 0
+        
+    # Frame times the smoothing factor is precomputed for (30 to 240 FPS)
+    _LUT_FRAME_TIMES = (1 / 30, 1 / 60, 1 / 120, 1 / 144, 1 / 240)
+    
+    @classmethod
+    def _build_alpha_lut(cls, lerp_speed: float) -> Dict[float, float]:
+        """Precompute frame-rate independent smoothing factors for common frame times."""
+        return {round(dt, 4): 1.0 - math.exp(-lerp_speed * dt) for dt in cls._LUT_FRAME_TIMES}
         
     def set_world_bounds(self, width: int, height: int):
         """Set the world boundaries for camera clamping."""
         self.world_width = width
         self.world_height = height
+        # Largest camera position that keeps the viewport inside the world
+        self._max_x = max(0, width - self.width)
+        self._max_y = max(0, height - self.height)
         
     def follow_target(self, target_x: float, target_y: float, dt: float, velocity_x: float = 0.0):
         """Update camera to follow a target position with smooth movement and lookahead."""
-        # Calculate desired camera position (center target on screen)
-        desired_x = target_x - self.width // 2
-        desired_y = target_y - self.height // 2
-        
-        # Add lookahead based on velocity
-        if abs(velocity_x) > 10:  # Only add lookahead when moving fast enough
-            # Gradually adjust lookahead
-            target_lookahead = self.lookahead_distance if velocity_x > 0 else -self.lookahead_distance
-            self.lookahead_smooth += (target_lookahead - self.lookahead_smooth) * dt * 3.0
-        else:
-            # Return to center when not moving
-            self.lookahead_smooth += (0 - self.lookahead_smooth) * dt * 2.0
+        half_w = self._half_w
+        half_h = self._half_h
+        x = self.x
+        y = self.y
+        
+        # Gradually adjust lookahead toward the movement direction when moving fast
+        # enough (rate 3), otherwise ease back to center (rate 2), without branching
+        active = float(abs(velocity_x) > 10)
+        target_lookahead = active * math.copysign(self.lookahead_distance, velocity_x)
+        lookahead = self.lookahead_smooth
+        lookahead += (target_lookahead - lookahead) * dt * (2.0 + active)
+        self.lookahead_smooth = lookahead
+        
+        # Only retarget (center target on screen, plus lookahead) outside the dead zone
+        target_x_cam = self.target_x
+        target_y_cam = self.target_y
+        if abs(target_x - (x + half_w)) > self._dead_zone_hw:
+            target_x_cam = target_x - half_w + lookahead
+        if abs(target_y - (y + half_h)) > self._dead_zone_hh:
+            target_y_cam = target_y - half_h
             
-        # Apply lookahead to desired position
-        desired_x += self.lookahead_smooth
-        
-        # Apply dead zone
-        camera_center_x = self.x + self.width // 2
-        camera_center_y = self.y + self.height // 2
-        
-        dx = target_x - camera_center_x
-        dy = target_y - camera_center_y
-        
-        # Only update target if outside dead zone
-        if abs(dx) > self.dead_zone_width // 2:
-            self.target_x = desired_x
-        if abs(dy) > self.dead_zone_height // 2:
-            self.target_y = desired_y
-        
-        # Smooth interpolation to target
-        self.x += (self.target_x - self.x) * self.lerp_speed * dt
-        self.y += (self.target_y - self.y) * self.lerp_speed * dt
+        # Smooth interpolation to target (exponential decay, stable under variable dt)
+        lerp = self._alpha_lut.get(round(dt, 4))
+        if lerp is None:
+            lerp = 1.0 - math.exp(-self.lerp_speed * dt)
+        self.target_x = target_x_cam
+        self.target_y = target_y_cam
+        self.x = x + (target_x_cam - x) * lerp
+        self.y = y + (target_y_cam - y) * lerp
             
         # Clamp camera to world bounds
         self._clamp_to_world()
         
     def set_position(self, x: float, y: float):
         """Set camera position directly."""
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
-        self._clamp_to_world()
+        self._apply_position(x, y)
         
     def center_on_target(self, target_x: float, target_y: float):
         """Center camera on target immediately."""
-        self.x = target_x - self.width // 2
-        self.y = target_y - self.height // 2
-        self.target_x = self.x
-        self.target_y = self.y
+        self._apply_position(target_x - self._half_w, target_y - self._half_h)
+        
+    def _apply_position(self, x: float, y: float):
+        """Move the camera and its target to a position without smoothing, then clamp."""
+        self.x = self.target_x = x
+        self.y = self.target_y = y
         self._clamp_to_world()
         
     def _clamp_to_world(self):
         """Clamp camera position to world boundaries."""
-        if self.world_width > 0 and self.world_height > 0:
+        x = self.x
+        y = self.y
+        width = self.width
+        height = self.height
+        world_width = self.world_width
+        world_height = self.world_height
+        
+        max_x = self._max_x
+        max_y = self._max_y
+        
+        # Common mid-map case: camera and target strictly inside the world, nothing to clamp
+        interior = (0 < x < max_x and 0 < y < max_y and
+                    0 <= self.target_x <= max_x and 0 <= self.target_y <= max_y)
+        
+        if not interior and world_width > 0 and world_height > 0:
             # Don't move camera if world is smaller than screen
-            if self.world_width < self.width:
-                self.x = (self.world_width - self.width) // 2
-                self.target_x = self.x
+            if world_width < width:
+                x = self.target_x = (world_width - width) // 2
             else:
-                self.x = max(0, min(self.x, self.world_width - self.width))
-                self.target_x = max(0, min(self.target_x, self.world_width - self.width))
+                if x > max_x:
+                    x = max_x
+                if x < 0:
+                    x = 0
+                target_x = self.target_x
+                if target_x > max_x:
+                    target_x = max_x
+                if target_x < 0:
+                    target_x = 0
+                self.target_x = target_x
                 
-            if self.world_height < self.height:
-                self.y = (self.world_height - self.height) // 2
-                self.target_y = self.y
+            if world_height < height:
+                y = self.target_y = (world_height - height) // 2
             else:
-                self.y = max(0, min(self.y, self.world_height - self.height))
-                self.target_y = max(0, min(self.target_y, self.world_height - self.height))
+                if y > max_y:
+                    y = max_y
+                if y < 0:
+                    y = 0
+                target_y = self.target_y
+                if target_y > max_y:
+                    target_y = max_y
+                if target_y < 0:
+                    target_y = 0
+                self.target_y = target_y
+                
+            self.x = x
+            self.y = y
+            
+        # Every position update ends here, so keep the pixel position, cached viewport and bounds in sync
+        ix = self._ix = int(x)
+        iy = self._iy = int(y)
+        self._viewport.x = ix
+        self._viewport.y = iy
+        self._vis_right = x + width
+        self._vis_bottom = y + height
                 
     def world_to_screen(self, world_x: float, world_y: float) -> Tuple[int, int]:
         """Convert world coordinates to screen coordinates."""
-        screen_x = int(world_x - self.x)
-        screen_y = int(world_y - self.y)
-        return screen_x, screen_y
+        return int(world_x) - self._ix, int(world_y) - self._iy
+        
+    def world_to_screen_batch(self, positions: Iterable[Tuple[float, float]]) -> List[Tuple[int, int]]:
+        """Convert many world positions to screen coordinates in one call."""
+        cam_x = self._ix
+        cam_y = self._iy
+        return [(int(world_x) - cam_x, int(world_y) - cam_y) for world_x, world_y in positions]
         
     def screen_to_world(self, screen_x: int, screen_y: int) -> Tuple[float, float]:
         """Convert screen coordinates to world coordinates."""
@@ -119,13 +188,13 @@ class Camera:
         return world_x, world_y
         
     def get_viewport_rect(self) -> pygame.Rect:
-        """Get the current viewport as a pygame Rect."""
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        """Get the current viewport as a pygame Rect (shared; copy it before modifying)."""
+        return self._viewport
         
     def is_visible(self, world_x: float, world_y: float, width: int = 0, height: int = 0) -> bool:
         """Check if a world position/rectangle is visible in the camera."""
-        return (self.x - width <= world_x <= self.x + self.width and
-                self.y - height <= world_y <= self.y + self.height)
+        return (self.x - width <= world_x <= self._vis_right and
+                self.y - height <= world_y <= self._vis_bottom)
                 
     def get_position(self) -> Tuple[float, float]:
         """Get current camera position."""
@@ -134,6 +203,7 @@ class Camera:
     def set_smoothing(self, lerp_speed: float):
         """Set camera smoothing speed (higher = faster following)."""
         self.lerp_speed = max(0.1, lerp_speed)
+        self._alpha_lut = self._build_alpha_lut(self.lerp_speed)
         
     def set_lookahead(self, distance: float):
         """Set camera lookahead distance."""
@@ -143,3 +213,5 @@ class Camera:
         """Set the size of the camera dead zone."""
         self.dead_zone_width = width
         self.dead_zone_height = height
+        self._dead_zone_hw = width // 2
+        self._dead_zone_hh = height // 2
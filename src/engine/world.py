@@ -1,32 +1,131 @@
 """World/TileMap class for managing game levels and collision detection."""
+import array
+import functools
+import itertools
 import json
+import logging
+import math
 import os
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
 
 import pygame
 
+try:
+    import orjson  # Optional: faster map parsing when installed
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Target edge length in pixels of the pre-rendered layer chunks drawn by render
+CHUNK_PIXELS = 256
+
+# Shortest run of one tile in a row that is baked into a chunk as a single strip
+_MIN_STRIP_RUN = 3
+
+# Bumped whenever the layout of the map grid cache changes
+_MAP_CACHE_VERSION = 4
+
+# Collision kinds stored per tile ID in World.collision_kind
+COLLISION_NONE = 0
+COLLISION_SOLID = 1
+COLLISION_PLATFORM = 2
+COLLISION_DAMAGE = 3
+COLLISION_WATER = 4
+COLLISION_ICE = 5
+COLLISION_TRIGGER = 6
+
+# Map editor collision type names, indexed by collision kind
+COLLISION_TYPE_NAMES = ('none', 'solid', 'platform', 'damage', 'water', 'ice', 'trigger')
+
+
+@functools.lru_cache(maxsize=256)
+def _collectible_type_from_name(obj_name: str) -> str:
+    """Infer a collectible type from keywords in an object name (checked in priority order)."""
+    obj_name_lower = obj_name.lower()
+    if 'bandage' in obj_name_lower:
+        return 'bandage'
+    elif 'key' in obj_name_lower:
+        return 'key'
+    elif 'ammo' in obj_name_lower:
+        return 'ammo'
+    elif 'health' in obj_name_lower:
+        return 'bandage'
+    elif 'potion' in obj_name_lower or 'bottle' in obj_name_lower:
+        return 'bottle'
+    
+    # Default fallback - for now, use bandage for testing
+    # TODO: This could be configurable or read from map editor
+    return 'bandage'
+
+
+class GameObject:
+    """
+    A map object (spawn, enemy, collectible, ...) with its position unpacked.
+    
+    The parsed object dict is kept as is for the fields the engine rarely
+    needs (custom_properties, editor color); get() reads it like the dict.
+    """
+    __slots__ = ('name', 'type', 'x', 'y', '_data')
+    
+    def __init__(self, data: Dict):
+        self.name = data.get('name')
+        self.type = data.get('type')
+        self.x = data.get('x', 0)
+        self.y = data.get('y', 0)
+        self._data = data
+        
+    @property
+    def custom_properties(self) -> Dict:
+        """The object's custom properties from the map editor."""
+        return self._data.get('custom_properties', {})
+        
+    def get(self, key: str, default=None):
+        """Dict-style access to any object field, as with the raw map data."""
+        return self._data.get(key, default)
+        
+    def __repr__(self) -> str:
+        return f"GameObject({self.name!r}, {self.type!r}, x={self.x}, y={self.y})"
+
 
 class World:
     """Manages the game world including tiles, collision, and objects."""
     
-    def __init__(self, map_path: str, scale: int = 1):
-        """Load a tile map from the map editor format."""
+    def __init__(self, map_path: str, scale: int = 1, verbose: bool = False):
+        """Load a tile map from the map editor format (verbose logs load details at INFO)."""
         self.scale = scale
-        self.tiles = []  # List of tile surfaces
+        self._log_level = logging.INFO if verbose else logging.DEBUG  # Level for load/spawn details
+        self.tiles: Tuple[pygame.Surface, ...] = ()  # Tile surfaces indexed by tile ID
         self.layers = []  # List of layer data
-        self.objects = []  # List of game objects (spawns, enemies, etc.)
+        self.objects: List[GameObject] = []  # Game objects (spawns, enemies, etc.)
         self.tile_size = 16
         self.map_cols = 0
         self.map_rows = 0
-        self.tile_properties = {}  # Collision data from map editor
+        self.pixel_tile_size = self.tile_size * scale  # Tile edge in world pixels
+        self.pixel_tile_mask: Optional[int] = None  # Snaps an int pixel to its tile edge (power-of-two tiles only)
+        self.pixel_width = 0  # World width in pixels
+        self.pixel_height = 0  # World height in pixels
+        self._world_bounds: Tuple[int, int] = (0, 0)
+        self._layer_grids: Tuple[List[array.array], ...] = ()  # Layer grids in layer order
+        self._grids_top_first: Tuple[List[array.array], ...] = ()  # Layer grids, topmost first
+        self.collision_grid = bytearray()  # Any-layer collision kind per map cell, row-major
+        self.tile_properties: Dict[int, Dict] = {}  # Collision data from map editor, by tile ID
+        self.collision_kind: array.array = array.array('B')  # Collision kind per tile ID, one byte each
+        self.collision_type_names: List[str] = list(COLLISION_TYPE_NAMES)
+        self._objects_by_type: Dict[Optional[str], List[GameObject]] = {}  # Objects indexed by type
+        self._objects_by_name: Dict[Optional[str], List[GameObject]] = {}  # Objects indexed by name
+        self._spawn_cache: Dict[str, List[Dict]] = {}  # World-coordinate spawn lists by kind
+        self._object_cells: Dict[Tuple[int, int], List[GameObject]] = {}  # Spatial hash of objects
+        self._object_cell_size = 1
+        self._chunk_px = CHUNK_PIXELS  # Chunk edge in pixels (a whole number of tiles)
+        self._strip_cache: Dict[Tuple[int, int], pygame.Surface] = {}  # (tile_id, run length) -> strip
         
         self.load_map(map_path)
         
     def load_map(self, map_path: str):
-        """Load the map data from JSON file."""
+        """Load the map data from JSON file (or its binary cache when up to date)."""
         # Load the map data
-        with open(map_path, 'r') as f:
-            map_data = json.load(f)
+        map_data = self._read_map_data(map_path)
         
         # Load tileset
         tileset_path = map_data['tileset']
@@ -39,45 +138,193 @@ class World:
         self.tile_size = map_data['tile_size']
         self.map_cols = map_data['map_cols']
         self.map_rows = map_data['map_rows']
+        self.pixel_tile_size = self.tile_size * self.scale
+        pixel_tile_size = self.pixel_tile_size
+        self.pixel_tile_mask = ~(pixel_tile_size - 1) if pixel_tile_size & (pixel_tile_size - 1) == 0 else None
+        self.pixel_width = self.map_cols * self.pixel_tile_size
+        self.pixel_height = self.map_rows * self.pixel_tile_size
+        self._world_bounds = (self.pixel_width, self.pixel_height)
         margin = map_data['margin']
         spacing = map_data['spacing']
         
-        # Load tile properties (collision data)
-        self.tile_properties = map_data.get('tile_properties', {})
-        collision_types = {}
-        for tile_id, props in self.tile_properties.items():
-            ctype = props.get('collision_type', 'none')
-            collision_types[ctype] = collision_types.get(ctype, 0) + 1
-        print(f"Loaded collision data for {len(self.tile_properties)} tile types:")
-        for ctype, count in collision_types.items():
-            print(f"  {ctype}: {count} tiles")
+        # Load tile properties (collision data), re-keyed from JSON strings to int tile IDs
+        self.tile_properties = {}
+        for tile_key, props in map_data.get('tile_properties', {}).items():
+            try:
+                self.tile_properties[int(tile_key)] = props
+            except ValueError:
+                logger.warning("Skipping tile properties with non-integer tile ID %r in %s", tile_key, map_path)
+        if logger.isEnabledFor(self._log_level):
+            collision_types = {}
+            for tile_id, props in self.tile_properties.items():
+                ctype = props.get('collision_type', 'none')
+                collision_types[ctype] = collision_types.get(ctype, 0) + 1
+            logger.log(self._log_level, "Loaded collision data for %d tile types:", len(self.tile_properties))
+            for ctype, count in collision_types.items():
+                logger.log(self._log_level, "  %s: %d tiles", ctype, count)
         
         # Load and slice tileset
         tileset_image = pygame.image.load(tileset_path).convert_alpha()
         self.slice_tileset(tileset_image, self.tile_size, margin, spacing)
+        # Drop our reference now: scaled tiles are copies, and unscaled subsurface
+        # tiles keep the sheet alive themselves only while they need it
+        del tileset_image
+        self._build_collision_table()
         
         # Load layers
+        self.layers.extend(map_data['layers'])
+        # Grids bound once so tile probes skip the per-call layer dict lookups
+        self._layer_grids = tuple(layer['grid'] for layer in self.layers)
+        self._grids_top_first = self._layer_grids[::-1]
+        self._build_collision_grid()
+        self._build_chunks()
+        
+        # Load objects (spawns, enemies, etc.)
+        self.objects = map_data.get('objects', [])
+        if logger.isEnabledFor(self._log_level):
+            logger.log(self._log_level, "Loaded %d objects:", len(self.objects))
+            for obj in self.objects:
+                logger.log(self._log_level, "  %s (%s) at (%s, %s)",
+                           obj.get('name', 'Unnamed'), obj.get('type', 'unknown'), obj.x, obj.y)
+        self._index_objects()
+    
+    def _read_map_data(self, map_path: str) -> Dict:
+        """
+        Read the map JSON, with each layer's tile list converted to a dense grid.
+        
+        The grids are cached next to the map as <map>.cache (a JSON header line
+        followed by the raw grid bytes) and reused while the map file's size and
+        modification time are unchanged, so later launches skip the tile lists.
+        """
+        cache_path = map_path + '.cache'
+        map_stat = os.stat(map_path)
+        source_key = [map_stat.st_size, map_stat.st_mtime_ns]
+        try:
+            map_data = self._read_map_cache(cache_path, source_key)
+            if map_data is not None:
+                return map_data
+        except (OSError, ValueError, EOFError) as e:
+            logger.debug("Not using map cache %s: %s", cache_path, e)  # Missing or unreadable: parse the JSON
+            
+        if orjson is not None:
+            with open(map_path, 'rb') as f:
+                map_data = orjson.loads(f.read())
+        else:
+            with open(map_path, 'r') as f:
+                map_data = json.load(f)
+                
+        map_cols = map_data['map_cols']
+        map_rows = map_data['map_rows']
+        
+        # Narrowest signed type that holds every tile ID, so -1 stays the empty marker
+        max_tile_id = max((tile['t'] for layer_data in map_data['layers'] for tile in layer_data['tiles']), default=-1)
+        typecode = 'b' if max_tile_id <= 127 else 'h' if max_tile_id <= 32767 else 'l'
+        empty_row = array.array(typecode, [-1]) * map_cols
+        
+        layers = []
         for layer_data in map_data['layers']:
             layer = {}
             layer['name'] = layer_data['name']
-            layer['tiles'] = {}
             
-            # Convert tile list to dictionary for faster lookup
+            # Dense grid indexed as grid[tile_y][tile_x] (-1 for empty), like the editor's layer data,
+            # with each row a packed array of 1 or 2 bytes per tile instead of a list of ints
+            grid = [array.array(typecode, empty_row) for _ in range(map_rows)]
             for tile in layer_data['tiles']:
-                key = (tile['x'], tile['y'])
-                layer['tiles'][key] = tile['t']
+                tile_x = tile['x']
+                tile_y = tile['y']
+                if 0 <= tile_x < map_cols and 0 <= tile_y < map_rows:
+                    grid[tile_y][tile_x] = tile['t']
+            layer['grid'] = grid
             
-            self.layers.append(layer)
+            layers.append(layer)
+        map_data['layers'] = layers
         
-        # Load objects (spawns, enemies, etc.)
-        self.objects = map_data.get('objects', [])
-        print(f"Loaded {len(self.objects)} objects:")
+        # Write the cache atomically (objects still as plain dicts); a read-only map folder just means no cache
+        try:
+            self._write_map_cache(cache_path, source_key, map_data, typecode)
+        except OSError as e:
+            logger.warning("Could not write map cache %s: %s", cache_path, e)
+            
+        map_data['objects'] = [GameObject(obj) for obj in map_data.get('objects', ())]
+        return map_data
+    
+    @staticmethod
+    def _write_map_cache(cache_path: str, source_key: List[int], map_data: Dict, typecode: str):
+        """Write map data as a JSON header line (everything but the grids) followed by every grid row's bytes."""
+        header = {
+            'cache_version': _MAP_CACHE_VERSION,
+            'source': source_key,
+            'typecode': typecode,
+            'layer_names': [layer['name'] for layer in map_data['layers']],
+            'map': {key: value for key, value in map_data.items() if key != 'layers'},
+        }
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8'))
+            f.write(b'\n')
+            for layer in map_data['layers']:
+                for row in layer['grid']:
+                    row.tofile(f)
+        os.replace(temp_path, cache_path)
+        
+    @staticmethod
+    def _read_map_cache(cache_path: str, source_key: List[int]) -> Optional[Dict]:
+        """Read map data written by _write_map_cache, or None if it was made from a different map file."""
+        with open(cache_path, 'rb') as f:
+            header = json.loads(f.readline())
+            if header.get('cache_version') != _MAP_CACHE_VERSION or header.get('source') != source_key:
+                return None
+            grid_bytes = memoryview(f.read())
+            
+        map_data = header['map']
+        typecode = header['typecode']
+        map_rows = map_data['map_rows']
+        row_size = array.array(typecode).itemsize * map_data['map_cols']
+        layer_names = header['layer_names']
+        if len(grid_bytes) != row_size * map_rows * len(layer_names):
+            raise EOFError("grid data is truncated")
+            
+        layers = []
+        offset = 0
+        for name in layer_names:
+            grid = []
+            for _ in range(map_rows):
+                row = array.array(typecode)
+                row.frombytes(grid_bytes[offset:offset + row_size])
+                offset += row_size
+                grid.append(row)
+            layers.append({'name': name, 'grid': grid})
+        map_data['layers'] = layers
+        map_data['objects'] = [GameObject(obj) for obj in map_data.get('objects', ())]
+        return map_data
+    
+    def _index_objects(self):
+        """Index objects by type and name in one pass, so finders don't scan every object."""
+        self._objects_by_type = {}
+        self._objects_by_name = {}
+        self._spawn_cache = {}
+        self._object_cells = {}
+        
+        # Spatial hash cells span two tiles, so a nearby-objects query touches only a few cells
+        scaled_tile_size = self.tile_size * self.scale
+        cell_size = self._object_cell_size = 2 * scaled_tile_size
         for obj in self.objects:
-            print(f"  {obj.get('name', 'Unnamed')} ({obj.get('type', 'unknown')}) at ({obj.get('x', 0)}, {obj.get('y', 0)})")
+            self._objects_by_type.setdefault(obj.type, []).append(obj)
+            self._objects_by_name.setdefault(obj.name, []).append(obj)
+            cell = (int(obj.x * scaled_tile_size // cell_size),
+                    int(obj.y * scaled_tile_size // cell_size))
+            self._object_cells.setdefault(cell, []).append(obj)
     
     def slice_tileset(self, tileset_surface: pygame.Surface, tile_size: int, margin: int, spacing: int):
-        """Slice the tileset into individual tile surfaces."""
-        self.tiles = []
+        """
+        Slice the tileset into individual tile surfaces.
+        
+        Tiles are converted to the display's pixel format, so this must be called
+        after pygame.display.set_mode() with a convert_alpha()'d tileset. Unscaled
+        tiles with transparency are subsurface views sharing the tileset's pixels.
+        """
+        tiles = []
+        scaled_size = tile_size * self.scale
         cols = (tileset_surface.get_width() - 2 * margin + spacing) // (tile_size + spacing)
         rows = (tileset_surface.get_height() - 2 * margin + spacing) // (tile_size + spacing)
         
@@ -86,84 +333,176 @@ class World:
                 x = margin + col * (tile_size + spacing)
                 y = margin + row * (tile_size + spacing)
                 
-                tile_surf = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-                tile_surf.blit(tileset_surface, (0, 0), (x, y, tile_size, tile_size))
+                tile_surf = tileset_surface.subsurface((x, y, tile_size, tile_size))
                 
                 if self.scale != 1:
-                    tile_surf = pygame.transform.scale(tile_surf, 
-                                                     (tile_size * self.scale, tile_size * self.scale))
+                    tile_surf = pygame.transform.scale(tile_surf, (scaled_size, scaled_size))
+                
+                # Match the display format so blits take SDL's fast path;
+                # fully opaque tiles drop per-pixel alpha altogether
+                if pygame.mask.from_surface(tile_surf, 254).count() == scaled_size * scaled_size:
+                    tile_surf = tile_surf.convert()
+                elif self.scale != 1:
+                    tile_surf = tile_surf.convert_alpha()
+                
+                tiles.append(tile_surf)
                 
-                self.tiles.append(tile_surf)
+        # Stored as a tuple: the tileset is fixed after slicing and tuples index fastest
+        self.tiles = tuple(tiles)
     
+    def _build_collision_table(self):
+        """Map every tile ID to a collision kind once, so collision probes are a list index."""
+        names = list(COLLISION_TYPE_NAMES)
+        kind_by_name = {name: kind for kind, name in enumerate(names)}
+        
+        entries = []
+        for tile_id, props in self.tile_properties.items():
+            if tile_id < 0:
+                continue
+                
+            # Keep collision types unknown to the engine so the string API still reports them
+            ctype = props.get('collision_type', 'none')
+            kind = kind_by_name.get(ctype)
+            if kind is None:
+                kind = kind_by_name[ctype] = len(names)
+                names.append(ctype)
+            entries.append((tile_id, kind))
+            
+        table_size = max([len(self.tiles)] + [tile_id + 1 for tile_id, _ in entries])
+        collision_kind = array.array('B', [COLLISION_NONE]) * table_size
+        for tile_id, kind in entries:
+            collision_kind[tile_id] = kind
+            
+        self.collision_kind = collision_kind
+        self.collision_type_names = names
+        
+    def _build_collision_grid(self):
+        """
+        Flatten the topmost non-empty tile's collision kind in every map cell into one byte grid.
+        
+        Any-layer collision probes (the ones entities make every frame) then
+        index a single bytearray instead of walking the layers.
+        """
+        map_cols = self.map_cols
+        collision_kind = self.collision_kind
+        table_size = len(collision_kind)
+        collision_grid = bytearray(self.map_rows * map_cols)
+        
+        for tile_y in range(self.map_rows):
+            rows_top_first = [grid[tile_y] for grid in self._grids_top_first]
+            row_start = tile_y * map_cols
+            for tile_x in range(map_cols):
+                for row in rows_top_first:
+                    tile_id = row[tile_x]
+                    if tile_id != -1:
+                        if 0 <= tile_id < table_size:
+                            collision_grid[row_start + tile_x] = collision_kind[tile_id]
+                        break
+                        
+        self.collision_grid = collision_grid
+        
     def find_spawn_point(self, name: str) -> Optional[Tuple[float, float]]:
         """Find a spawn point by name. Returns (world_x, world_y) in pixels or None if not found."""
-        for obj in self.objects:
-            if obj.get('name') == name and obj.get('type') == 'spawn':
+        for obj in self._objects_by_name.get(name, ()):
+            if obj.type == 'spawn':
                 # Convert grid coordinates to world coordinates
-                grid_x = obj.get('x', 0)
-                grid_y = obj.get('y', 0)
+                grid_x = obj.x
+                grid_y = obj.y
                 world_x = float(grid_x * self.tile_size * self.scale)
                 world_y = float(grid_y * self.tile_size * self.scale)
                 return (world_x, world_y)
         return None
     
-    def find_objects_by_type(self, object_type: str) -> List[Dict]:
+    def find_objects_by_type(self, object_type: str) -> List[GameObject]:
         """Find all objects of a specific type."""
-        return [obj for obj in self.objects if obj.get('type') == object_type]
+        return list(self._objects_by_type.get(object_type, ()))
     
-    def find_objects_by_name(self, name: str) -> List[Dict]:
+    def find_objects_by_name(self, name: str) -> List[GameObject]:
         """Find all objects with a specific name."""
-        return [obj for obj in self.objects if obj.get('name') == name]
+        return list(self._objects_by_name.get(name, ()))
+    
+    def find_objects_near(self, world_x: float, world_y: float, radius: float) -> List[GameObject]:
+        """Find all objects whose world position lies within radius of a world position."""
+        scaled_tile_size = self.tile_size * self.scale
+        cell_size = self._object_cell_size
+        min_cell_x = int((world_x - radius) // cell_size)
+        max_cell_x = int((world_x + radius) // cell_size)
+        min_cell_y = int((world_y - radius) // cell_size)
+        max_cell_y = int((world_y + radius) // cell_size)
+        radius_sq = radius * radius
+        
+        nearby = []
+        cells = self._object_cells
+        for cell_y in range(min_cell_y, max_cell_y + 1):
+            for cell_x in range(min_cell_x, max_cell_x + 1):
+                for obj in cells.get((cell_x, cell_y), ()):
+                    dx = obj.x * scaled_tile_size - world_x
+                    dy = obj.y * scaled_tile_size - world_y
+                    if dx * dx + dy * dy <= radius_sq:
+                        nearby.append(obj)
+        return nearby
     
     def find_enemy_spawn_points(self) -> List[Dict]:
-        """Find all enemy spawn points and convert to world coordinates."""
+        """Find all enemy spawn points and convert to world coordinates (shared list; copy before modifying)."""
+        enemy_spawns = self._spawn_cache.get('enemy')
+        if enemy_spawns is not None:
+            return enemy_spawns
+            
         enemy_spawns = []
-        for obj in self.objects:
-            if obj.get('type') == 'enemy':
-                # Convert tile coordinates to world coordinates
-                world_x = obj.get('x', 0) * self.tile_size * self.scale
-                world_y = obj.get('y', 0) * self.tile_size * self.scale
-                
-                spawn_info = {
-                    'name': obj.get('name', 'Unknown'),
-                    'world_x': world_x,
-                    'world_y': world_y,
-                    'tile_x': obj.get('x', 0),
-                    'tile_y': obj.get('y', 0),
-                    'custom_properties': obj.get('custom_properties', {})
-                }
-                enemy_spawns.append(spawn_info)
-                
+        for obj in self._objects_by_type.get('enemy', ()):
+            # Convert tile coordinates to world coordinates
+            world_x = obj.x * self.tile_size * self.scale
+            world_y = obj.y * self.tile_size * self.scale
+            
+            spawn_info = {
+                'name': obj.get('name', 'Unknown'),
+                'world_x': world_x,
+                'world_y': world_y,
+                'tile_x': obj.x,
+                'tile_y': obj.y,
+                'custom_properties': obj.custom_properties
+            }
+            enemy_spawns.append(spawn_info)
+            
+        self._spawn_cache['enemy'] = enemy_spawns
         return enemy_spawns
     
     def find_collectible_spawn_points(self) -> List[Dict]:
-        """Find all collectible spawn points and convert to world coordinates."""
+        """Find all collectible spawn points and convert to world coordinates (shared list; copy before modifying)."""
+        collectible_spawns = self._spawn_cache.get('collectible')
+        if collectible_spawns is not None:
+            return collectible_spawns
+            
         collectible_spawns = []
-        for obj in self.objects:
-            if obj.get('type') == 'collectible':
-                # Convert tile coordinates to world coordinates
-                world_x = obj.get('x', 0) * self.tile_size * self.scale
-                world_y = obj.get('y', 0) * self.tile_size * self.scale
-                
-                # Determine collectible type from name (e.g., "Collectible_01" -> "bandage")
-                obj_name = obj.get('name', 'Unknown')
-                collectible_type = self._parse_collectible_type(obj_name, obj)
-                
-                spawn_info = {
-                    'name': obj_name,
-                    'collectible_type': collectible_type,
-                    'world_x': world_x,
-                    'world_y': world_y,
-                    'tile_x': obj.get('x', 0),
-                    'tile_y': obj.get('y', 0),
-                    'custom_properties': obj.get('custom_properties', {})
-                }
-                collectible_spawns.append(spawn_info)
-                
+        for obj in self._objects_by_type.get('collectible', ()):
+            # Convert tile coordinates to world coordinates
+            world_x = obj.x * self.tile_size * self.scale
+            world_y = obj.y * self.tile_size * self.scale
+            
+            # Determine collectible type from name (e.g., "Collectible_01" -> "bandage")
+            obj_name = obj.get('name', 'Unknown')
+            collectible_type = self._parse_collectible_type(obj_name, obj)
+            
+            spawn_info = {
+                'name': obj_name,
+                'collectible_type': collectible_type,
+                'world_x': world_x,
+                'world_y': world_y,
+                'tile_x': obj.x,
+                'tile_y': obj.y,
+                'custom_properties': obj.custom_properties
+            }
+            collectible_spawns.append(spawn_info)
+            
+        self._spawn_cache['collectible'] = collectible_spawns
         return collectible_spawns
     
     def find_chest_spawn_points(self) -> List[Dict]:
-        """Find all chest spawn points and convert to world coordinates."""
+        """Find all chest spawn points and convert to world coordinates (shared list; copy before modifying)."""
+        chest_spawns = self._spawn_cache.get('chest')
+        if chest_spawns is not None:
+            return chest_spawns
+            
         chest_spawns = []
         for obj in self.objects:
             obj_name = obj.get('name', 'Unknown')
@@ -186,28 +525,30 @@ class World:
             # Fallback check: collectible type objects with 'chest' in name (legacy support)
             elif obj_type == 'collectible' and 'chest' in obj_name.lower():
                 is_chest = True
-                print(f"Warning: Found chest object '{obj_name}' with 'collectible' type. Consider changing to 'chest' type.")
+                logger.warning("Found chest object '%s' with 'collectible' type. Consider changing to 'chest' type.", obj_name)
             
             if is_chest:
                 # Convert tile coordinates to world coordinates
-                world_x = obj.get('x', 0) * self.tile_size * self.scale
-                world_y = obj.get('y', 0) * self.tile_size * self.scale
+                world_x = obj.x * self.tile_size * self.scale
+                world_y = obj.y * self.tile_size * self.scale
                 
                 spawn_info = {
                     'name': obj_name,
                     'chest_type': chest_type,
                     'world_x': world_x,
                     'world_y': world_y,
-                    'tile_x': obj.get('x', 0),
-                    'tile_y': obj.get('y', 0),
-                    'custom_properties': obj.get('custom_properties', {})
+                    'tile_x': obj.x,
+                    'tile_y': obj.y,
+                    'custom_properties': obj.custom_properties
                 }
                 chest_spawns.append(spawn_info)
-                print(f"Found chest spawn: {obj_name} at tile ({obj.get('x', 0)}, {obj.get('y', 0)}) -> world ({world_x}, {world_y})")
+                logger.log(self._log_level, "Found chest spawn: %s at tile (%s, %s) -> world (%s, %s)",
+                           obj_name, obj.x, obj.y, world_x, world_y)
                 
+        self._spawn_cache['chest'] = chest_spawns
         return chest_spawns
     
-    def _parse_collectible_type(self, obj_name: str, obj: Dict) -> str:
+    def _parse_collectible_type(self, obj_name: str, obj: GameObject) -> str:
         """
         Parse the collectible type from object name or properties.
         
@@ -219,145 +560,320 @@ class World:
             str: Collectible type (e.g., "bandage", "key", "ammo")
         """
         # Check if custom properties specify the type
-        custom_props = obj.get('custom_properties', {})
+        custom_props = obj.custom_properties
         if 'collectible_type' in custom_props:
             return custom_props['collectible_type']
         
-        # Check for type in the name
-        obj_name_lower = obj_name.lower()
-        if 'bandage' in obj_name_lower:
-            return 'bandage'
-        elif 'key' in obj_name_lower:
-            return 'key'
-        elif 'ammo' in obj_name_lower:
-            return 'ammo'
-        elif 'health' in obj_name_lower:
-            return 'bandage'
-        elif 'potion' in obj_name_lower or 'bottle' in obj_name_lower:
-            return 'bottle'
-        
-        # Default fallback - for now, use bandage for testing
-        # TODO: This could be configurable or read from map editor
-        return 'bandage'
+        # Check for type in the name (memoized, since maps repeat collectible names)
+        return _collectible_type_from_name(obj_name)
     
     def get_tile_at(self, world_x: float, world_y: float, layer_index: int = 0) -> int:
         """Get the tile ID at a world position (returns -1 if no tile)."""
-        tile_x = int(world_x // (self.tile_size * self.scale))
-        tile_y = int(world_y // (self.tile_size * self.scale))
+        # Floor to whole pixels first, so the tile index is integer floor division
+        scaled_tile_size = self.pixel_tile_size
+        tile_x = math.floor(world_x) // scaled_tile_size
+        tile_y = math.floor(world_y) // scaled_tile_size
         
-        if layer_index < len(self.layers):
-            return self.layers[layer_index]['tiles'].get((tile_x, tile_y), -1)
+        if layer_index < len(self._layer_grids) and 0 <= tile_x < self.map_cols and 0 <= tile_y < self.map_rows:
+            return self._layer_grids[layer_index][tile_y][tile_x]
         return -1
     
     def get_tile_at_any_layer(self, world_x: float, world_y: float) -> int:
         """Get the first non-empty tile ID found across all layers (returns -1 if no tile)."""
-        tile_x = int(world_x // (self.tile_size * self.scale))
-        tile_y = int(world_y // (self.tile_size * self.scale))
+        scaled_tile_size = self.pixel_tile_size
+        tile_x = math.floor(world_x) // scaled_tile_size
+        tile_y = math.floor(world_y) // scaled_tile_size
+        
+        if not (0 <= tile_x < self.map_cols and 0 <= tile_y < self.map_rows):
+            return -1
         
         # Check all layers from top to bottom (last to first for visibility priority)
-        for layer_index in range(len(self.layers) - 1, -1, -1):
-            tile_id = self.layers[layer_index]['tiles'].get((tile_x, tile_y), -1)
+        for grid in self._grids_top_first:
+            tile_id = grid[tile_y][tile_x]
             if tile_id != -1:
                 return tile_id
         return -1
     
+    def _kind_of(self, tile_id: int) -> int:
+        """Get the collision kind of a tile ID (COLLISION_NONE for empty or unknown tiles)."""
+        collision_kind = self.collision_kind
+        if 0 <= tile_id < len(collision_kind):
+            return collision_kind[tile_id]
+        return COLLISION_NONE
+    
+    def get_collision_kind_at(self, world_x: float, world_y: float, layer_index: int = 0) -> int:
+        """Get the collision kind (COLLISION_* constant) at a world position."""
+        return self._kind_of(self.get_tile_at(world_x, world_y, layer_index))
+    
+    def get_collision_kind_at_any_layer(self, world_x: float, world_y: float) -> int:
+        """Get the collision kind (COLLISION_* constant) at a world position, checking all layers."""
+        scaled_tile_size = self.pixel_tile_size
+        tile_x = math.floor(world_x) // scaled_tile_size
+        tile_y = math.floor(world_y) // scaled_tile_size
+        map_cols = self.map_cols
+        if 0 <= tile_x < map_cols and 0 <= tile_y < self.map_rows:
+            return self.collision_grid[tile_y * map_cols + tile_x]
+        return COLLISION_NONE
+    
+    def _tile_ids_at(self, points: Iterable[Tuple[float, float]], layer_index: Optional[int]) -> Iterator[int]:
+        """Yield the tile ID under each world position (None layer_index checks all layers, top first)."""
+        scaled_tile_size = self.pixel_tile_size
+        floor = math.floor
+        map_cols = self.map_cols
+        map_rows = self.map_rows
+        if layer_index is None:
+            grids = self._grids_top_first
+        elif layer_index < len(self._layer_grids):
+            grids = (self._layer_grids[layer_index],)
+        else:
+            grids = ()
+            
+        for world_x, world_y in points:
+            tile_x = floor(world_x) // scaled_tile_size
+            tile_y = floor(world_y) // scaled_tile_size
+            tile_id = -1
+            if 0 <= tile_x < map_cols and 0 <= tile_y < map_rows:
+                for grid in grids:
+                    tile_id = grid[tile_y][tile_x]
+                    if tile_id != -1:
+                        break
+            yield tile_id
+    
+    def is_solid_at_many(self, points: Iterable[Tuple[float, float]], layer_index: int = 0) -> List[bool]:
+        """Check several world positions for solid tiles in one call (e.g. an entity's probe points)."""
+        kind_of = self._kind_of
+        return [kind_of(tile_id) == COLLISION_SOLID for tile_id in self._tile_ids_at(points, layer_index)]
+    
+    def is_solid_at_any_layer_many(self, points: Iterable[Tuple[float, float]]) -> List[bool]:
+        """Check several world positions for solid tiles across any layer in one call."""
+        scaled_tile_size = self.pixel_tile_size
+        floor = math.floor
+        map_cols = self.map_cols
+        map_rows = self.map_rows
+        collision_grid = self.collision_grid
+        
+        solid = []
+        for world_x, world_y in points:
+            tile_x = floor(world_x) // scaled_tile_size
+            tile_y = floor(world_y) // scaled_tile_size
+            solid.append(0 <= tile_x < map_cols and 0 <= tile_y < map_rows and
+                         collision_grid[tile_y * map_cols + tile_x] == COLLISION_SOLID)
+        return solid
+    
+    def _is_solid_tile(self, tile_x: int, tile_y: int) -> bool:
+        """Check whether the topmost non-empty tile in a map cell (any layer) is solid."""
+        if not (0 <= tile_x < self.map_cols and 0 <= tile_y < self.map_rows):
+            return False
+        return self.collision_grid[tile_y * self.map_cols + tile_x] == COLLISION_SOLID
+    
+    def raycast(self, start_x: float, start_y: float, end_x: float, end_y: float) -> Optional[float]:
+        """
+        Trace a line segment through the tile grid (e.g. for line of sight or projectiles).
+        
+        Walks only the cells the segment crosses (grid DDA), checking solidity
+        across all layers like is_solid_at_any_layer.
+        
+        Returns:
+            Distance from the start point to the first solid tile, or None if the
+            segment is clear
+        """
+        scaled_tile_size = self.pixel_tile_size
+        tile_x = math.floor(start_x / scaled_tile_size)
+        tile_y = math.floor(start_y / scaled_tile_size)
+        if self._is_solid_tile(tile_x, tile_y):
+            return 0.0
+            
+        delta_x = end_x - start_x
+        delta_y = end_y - start_y
+        length = math.hypot(delta_x, delta_y)
+        if length == 0:
+            return None
+        dir_x = delta_x / length
+        dir_y = delta_y / length
+        
+        # Distance along the ray to the first vertical/horizontal grid line, and between lines
+        step_x = 1 if dir_x > 0 else -1
+        step_y = 1 if dir_y > 0 else -1
+        if dir_x:
+            next_x = (tile_x + (step_x > 0)) * scaled_tile_size
+            t_max_x = (next_x - start_x) / dir_x
+            t_delta_x = scaled_tile_size / abs(dir_x)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dir_y:
+            next_y = (tile_y + (step_y > 0)) * scaled_tile_size
+            t_max_y = (next_y - start_y) / dir_y
+            t_delta_y = scaled_tile_size / abs(dir_y)
+        else:
+            t_max_y = t_delta_y = math.inf
+            
+        is_solid_tile = self._is_solid_tile
+        while True:
+            if t_max_x < t_max_y:
+                distance = t_max_x
+                tile_x += step_x
+                t_max_x += t_delta_x
+            else:
+                distance = t_max_y
+                tile_y += step_y
+                t_max_y += t_delta_y
+            if distance > length:
+                return None
+            if is_solid_tile(tile_x, tile_y):
+                return distance
+    
     def get_collision_type_at(self, world_x: float, world_y: float, layer_index: int = 0) -> str:
         """Get the collision type at a world position."""
-        tile_id = self.get_tile_at(world_x, world_y, layer_index)
-        if tile_id == -1:
-            return "none"
-        
-        tile_props = self.tile_properties.get(str(tile_id), {})
-        return tile_props.get('collision_type', 'none')
+        return self.collision_type_names[self.get_collision_kind_at(world_x, world_y, layer_index)]
     
     def get_collision_type_at_any_layer(self, world_x: float, world_y: float) -> str:
         """Get the collision type at a world position, checking all layers."""
-        tile_id = self.get_tile_at_any_layer(world_x, world_y)
-        if tile_id == -1:
-            return "none"
-        
-        tile_props = self.tile_properties.get(str(tile_id), {})
-        return tile_props.get('collision_type', 'none')
+        return self.collision_type_names[self.get_collision_kind_at_any_layer(world_x, world_y)]
     
     def is_solid_at(self, world_x: float, world_y: float, layer_index: int = 0) -> bool:
         """Check if there's a solid tile at the world position."""
-        collision_type = self.get_collision_type_at(world_x, world_y, layer_index)
-        return collision_type == "solid"
+        return self.get_collision_kind_at(world_x, world_y, layer_index) == COLLISION_SOLID
     
     def is_solid_at_any_layer(self, world_x: float, world_y: float) -> bool:
         """Check if there's a solid tile at the world position across any layer."""
-        collision_type = self.get_collision_type_at_any_layer(world_x, world_y)
-        return collision_type == "solid"
+        return self.get_collision_kind_at_any_layer(world_x, world_y) == COLLISION_SOLID
     
     def is_platform_at(self, world_x: float, world_y: float, layer_index: int = 0) -> bool:
         """Check if there's a platform tile at the world position (jump-through)."""
-        collision_type = self.get_collision_type_at(world_x, world_y, layer_index)
-        return collision_type == "platform"
+        return self.get_collision_kind_at(world_x, world_y, layer_index) == COLLISION_PLATFORM
     
     def is_platform_at_any_layer(self, world_x: float, world_y: float) -> bool:
         """Check if there's a platform tile at the world position across any layer."""
-        collision_type = self.get_collision_type_at_any_layer(world_x, world_y)
-        return collision_type == "platform"
+        return self.get_collision_kind_at_any_layer(world_x, world_y) == COLLISION_PLATFORM
     
     def is_damage_at(self, world_x: float, world_y: float, layer_index: int = 0) -> bool:
         """Check if there's a damage tile at the world position."""
-        collision_type = self.get_collision_type_at(world_x, world_y, layer_index)
-        return collision_type == "damage"
+        return self.get_collision_kind_at(world_x, world_y, layer_index) == COLLISION_DAMAGE
     
     def is_water_at(self, world_x: float, world_y: float, layer_index: int = 0) -> bool:
         """Check if there's a water tile at the world position."""
-        collision_type = self.get_collision_type_at(world_x, world_y, layer_index)
-        return collision_type == "water"
+        return self.get_collision_kind_at(world_x, world_y, layer_index) == COLLISION_WATER
     
     def is_ice_at(self, world_x: float, world_y: float, layer_index: int = 0) -> bool:
         """Check if there's an ice tile at the world position."""
-        collision_type = self.get_collision_type_at(world_x, world_y, layer_index)
-        return collision_type == "ice"
+        return self.get_collision_kind_at(world_x, world_y, layer_index) == COLLISION_ICE
     
     def is_trigger_at(self, world_x: float, world_y: float, layer_index: int = 0) -> bool:
         """Check if there's a trigger tile at the world position."""
-        collision_type = self.get_collision_type_at(world_x, world_y, layer_index)
-        return collision_type == "trigger"
+        return self.get_collision_kind_at(world_x, world_y, layer_index) == COLLISION_TRIGGER
     
     def has_collision_at(self, world_x: float, world_y: float, layer_index: int = 0) -> bool:
         """Check if there's any collision (solid or platform) at the world position."""
-        collision_type = self.get_collision_type_at(world_x, world_y, layer_index)
-        return collision_type in ["solid", "platform"]
+        kind = self.get_collision_kind_at(world_x, world_y, layer_index)
+        return kind == COLLISION_SOLID or kind == COLLISION_PLATFORM
     
     def get_tile_properties(self, tile_id: int) -> Dict:
         """Get the full properties dictionary for a tile ID."""
-        return self.tile_properties.get(str(tile_id), {})
+        return self.tile_properties.get(tile_id, {})
     
     def get_world_bounds(self) -> Tuple[int, int]:
         """Get the world dimensions in pixels."""
-        width = self.map_cols * self.tile_size * self.scale
-        height = self.map_rows * self.tile_size * self.scale
-        return width, height
+        return self._world_bounds
     
     def is_position_in_bounds(self, world_x: float, world_y: float) -> bool:
         """Check if a position is within the world bounds."""
-        width, height = self.get_world_bounds()
-        return 0 <= world_x <= width and 0 <= world_y <= height
+        return 0 <= world_x <= self.pixel_width and 0 <= world_y <= self.pixel_height
+    
+    def _build_chunks(self):
+        """
+        Pre-render every layer into chunk surfaces of about CHUNK_PIXELS square.
+        
+        Layers never change after loading, so render only has to blit the few
+        visible chunks per layer instead of every visible tile. Chunks without
+        any tiles are not stored, and runs of one tile are baked as strips.
+        """
+        scaled_tile_size = self.tile_size * self.scale
+        chunk_tiles = max(1, CHUNK_PIXELS // scaled_tile_size)
+        chunk_px = self._chunk_px = chunk_tiles * scaled_tile_size
+        tiles = self.tiles
+        tile_count = len(tiles)
+        get_strip = self._get_strip
+        
+        for layer in self.layers:
+            chunk_blits: Dict[Tuple[int, int], list] = {}
+            for tile_y, row in enumerate(layer['grid']):
+                chunk_y, local_y = divmod(tile_y, chunk_tiles)
+                draw_y = local_y * scaled_tile_size
+                for chunk_x, chunk_start in enumerate(range(0, len(row), chunk_tiles)):
+                    # Runs of the same tile are copied in as one pre-stitched strip
+                    surfaces = []
+                    local_x = 0
+                    for tile_id, run in itertools.groupby(row[chunk_start:chunk_start + chunk_tiles]):
+                        run_length = sum(1 for _ in run)
+                        if 0 <= tile_id < tile_count:
+                            if run_length >= _MIN_STRIP_RUN:
+                                surfaces.append((get_strip(tile_id, run_length), local_x))
+                            else:
+                                tile = tiles[tile_id]
+                                surfaces.extend((tile, x) for x in range(local_x, local_x + run_length))
+                        local_x += run_length
+                    if not surfaces:
+                        continue
+                        
+                    blit_sequence = chunk_blits.setdefault((chunk_x, chunk_y), [])
+                    for surface, x in surfaces:
+                        # Copy alpha pixels onto the transparent chunk instead of blending them
+                        flags = pygame.BLEND_RGBA_MAX if surface.get_flags() & pygame.SRCALPHA else 0
+                        blit_sequence.append((surface, (x * scaled_tile_size, draw_y), None, flags))
+                        
+            chunks = {}
+            for chunk_key, blit_sequence in chunk_blits.items():
+                chunk = pygame.Surface((chunk_px, chunk_px), pygame.SRCALPHA).convert_alpha()
+                chunk.blits(blit_sequence, doreturn=False)
+                chunks[chunk_key] = chunk
+            layer['chunks'] = chunks
+            
+        # Strips are only needed while baking
+        self._strip_cache.clear()
+        
+    def _get_strip(self, tile_id: int, run_length: int) -> pygame.Surface:
+        """Get (building once) a surface holding run_length copies of a tile side by side."""
+        key = (tile_id, run_length)
+        strip = self._strip_cache.get(key)
+        if strip is None:
+            tile = self.tiles[tile_id]
+            tile_width, tile_height = tile.get_size()
+            if tile.get_flags() & pygame.SRCALPHA:
+                # Copy pixels (alpha included) onto the transparent strip instead of blending them
+                strip = pygame.Surface((tile_width * run_length, tile_height), pygame.SRCALPHA).convert_alpha()
+                flags = pygame.BLEND_RGBA_MAX
+            else:
+                strip = pygame.Surface((tile_width * run_length, tile_height)).convert()
+                flags = 0
+            strip.blits([(tile, (i * tile_width, 0), None, flags) for i in range(run_length)], doreturn=False)
+            self._strip_cache[key] = strip
+        return strip
     
     def render(self, screen: pygame.Surface, camera_x: float = 0, camera_y: float = 0):
         """Render the tile map with camera offset."""
-        scaled_tile_size = self.tile_size * self.scale
+        chunk_px = self._chunk_px
+        
+        # Whole-pixel offset matching int(world - camera) for on-screen positions
+        offset_x = -math.ceil(camera_x)
+        offset_y = -math.ceil(camera_y)
         
-        # Calculate visible tile range
-        start_x = max(0, int(camera_x // scaled_tile_size))
-        start_y = max(0, int(camera_y // scaled_tile_size))
-        end_x = min(self.map_cols, start_x + (screen.get_width() // scaled_tile_size) + 2)
-        end_y = min(self.map_rows, start_y + (screen.get_height() // scaled_tile_size) + 2)
+        # Calculate visible chunk range
+        start_cx = max(0, -offset_x // chunk_px)
+        start_cy = max(0, -offset_y // chunk_px)
+        end_cx = (screen.get_width() - offset_x - 1) // chunk_px + 1
+        end_cy = (screen.get_height() - offset_y - 1) // chunk_px + 1
         
-        # Render each layer
+        # Draw the visible chunks of every layer (in layer order) in one batch
+        blit_sequence = []
         for layer in self.layers:
-            for tile_y in range(start_y, end_y):
-                for tile_x in range(start_x, end_x):
-                    tile_id = layer['tiles'].get((tile_x, tile_y), -1)
-                    if tile_id != -1 and tile_id < len(self.tiles):
-                        draw_x = tile_x * scaled_tile_size - camera_x
-                        draw_y = tile_y * scaled_tile_size - camera_y
-                        screen.blit(self.tiles[tile_id], (draw_x, draw_y))
+            chunks = layer['chunks']
+            for chunk_y in range(start_cy, end_cy):
+                draw_y = chunk_y * chunk_px + offset_y
+                for chunk_x in range(start_cx, end_cx):
+                    chunk = chunks.get((chunk_x, chunk_y))
+                    if chunk is not None:
+                        blit_sequence.append((chunk, (chunk_x * chunk_px + offset_x, draw_y)))
+        screen.blits(blit_sequence, doreturn=False)
 
 
 # Legacy alias for backwards compatibility
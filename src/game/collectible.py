@@ -10,11 +10,33 @@ Classes:
     BandageCollectible: Health restoration item
 """
 
+import logging
 import math
+from array import array
+
 import pygame
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+from ..animations import AnimationFrames, CollectibleAnimationLoader
+
+logger = logging.getLogger(__name__)
+
+# Draw collision boxes in Collectible.render
+DEBUG_COLLISION = False
+
+# Sine lookup table for the bobbing motion: one period in 1024 steps
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = array('f', [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)])
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)  # Radians to table index
+_TWO_PI = 2 * math.pi
+
+# One animation loader per (sprite sheet JSON, scale), shared by every collectible using it
+_LOADER_CACHE: Dict[Tuple[str, int], CollectibleAnimationLoader] = {}
 
-from ..animations import CollectibleAnimationLoader
+
+def _round_half_away(value: float) -> int:
+    """Round to the nearest int with halves going away from zero, as pygame's Rect does."""
+    return int(value + 0.5) if value >= 0 else int(value - 0.5)
 
 
 class Collectible:
@@ -33,6 +55,14 @@ class Collectible:
     - Pickup behavior and effects
     """
     
+    __slots__ = ('spawn_x', 'spawn_y', 'scale', 'float_height', 'current_x', 'current_y',
+                 'bob_amplitude', 'bob_speed', 'bob_time', 'base_float_y',
+                 'collectible_type', 'is_active', 'is_collected',
+                 'animation_loader', 'current_animation', 'animation_time', 'current_frame',
+                 'sprite_surface', '_cached_animation', '_animation_data',
+                 'collision_width', 'collision_height', '_half_w', '_half_h', '_collision_rect',
+                 '_sized_surface', '_sprite_half_w', '_sprite_half_h')
+    
     def __init__(self, spawn_x: float, spawn_y: float, collectible_type: str, scale: int = 2):
         """
         Initialize a collectible item.
@@ -70,10 +100,20 @@ class Collectible:
         self.animation_time = 0.0
         self.current_frame = 0  # Current frame index
         self.sprite_surface: Optional[pygame.Surface] = None
+        self._cached_animation: Optional[str] = None  # Animation name _animation_data was resolved for
+        self._animation_data: Optional[AnimationFrames] = None  # Frames of current_animation
         
         # Collision detection
         self.collision_width = 16 * scale  # Width of collision box
         self.collision_height = 16 * scale  # Height of collision box
+        self._half_w = self.collision_width // 2
+        self._half_h = self.collision_height // 2
+        self._collision_rect = pygame.Rect(0, 0, self.collision_width, self.collision_height)  # Reused by get_collision_rect
+        
+        # Half size of the last rendered sprite surface, for centering without a Rect
+        self._sized_surface: Optional[pygame.Surface] = None
+        self._sprite_half_w = 0
+        self._sprite_half_h = 0
         
         # Initialize animation
         self._setup_animation()
@@ -84,36 +124,40 @@ class Collectible:
             # Use collectibles sprite sheet
             collectibles_json = "Assests/collectibles/collects.json"
             
-            # Create animation loader
-            self.animation_loader = CollectibleAnimationLoader(
-                collectibles_json, 
-                scale=self.scale
-            )
+            # Reuse the shared animation loader (frames are read-only), creating it on first use
+            cache_key = (collectibles_json, self.scale)
+            self.animation_loader = _LOADER_CACHE.get(cache_key)
+            if self.animation_loader is None:
+                self.animation_loader = _LOADER_CACHE[cache_key] = CollectibleAnimationLoader(
+                    collectibles_json, 
+                    scale=self.scale
+                )
             
             # Check if the animation loader loaded properly
-            if self.animation_loader.load():
-                print(f"Loaded animation system for {self.collectible_type} collectible")
+            if self.animation_loader.loaded or self.animation_loader.load():
+                logger.debug("Loaded animation system for %s collectible", self.collectible_type)
                 
                 # For collectibles, we directly use the collectible type name as animation
                 # (e.g., 'bandage' collectible uses 'bandage' animation)
                 if self.animation_loader.aseprite_loader.get_animation(self.collectible_type):
-                    print(f"Found animation '{self.collectible_type}' in sprite data")
+                    logger.debug("Found animation '%s' in sprite data", self.collectible_type)
                     self.current_animation = self.collectible_type
-                    # Load this specific animation
-                    if self.animation_loader._load_animation(self.collectible_type, self.collectible_type):
-                        print(f"Successfully loaded {self.collectible_type} animation")
+                    # Load this specific animation (once per shared loader)
+                    if (self.collectible_type in self.animation_loader.animations or
+                            self.animation_loader._load_animation(self.collectible_type, self.collectible_type)):
+                        logger.debug("Successfully loaded %s animation", self.collectible_type)
                     else:
-                        print(f"Failed to load {self.collectible_type} animation, using fallback")
+                        logger.warning("Failed to load %s animation, using fallback", self.collectible_type)
                         self._create_fallback_animation()
                 else:
-                    print(f"Animation '{self.collectible_type}' not found in sprite data")
+                    logger.debug("Animation '%s' not found in sprite data", self.collectible_type)
                     self._create_fallback_animation()
             else:
-                print(f"Warning: Failed to load animation loader for {self.collectible_type} collectible")
+                logger.warning("Failed to load animation loader for %s collectible", self.collectible_type)
                 self._create_fallback_animation()
                 
         except Exception as e:
-            print(f"Error setting up collectible animation: {e}")
+            logger.warning("Error setting up collectible animation: %s", e)
             self.animation_loader = None
             self._create_fallback_animation()
     
@@ -135,32 +179,46 @@ class Collectible:
         pygame.draw.rect(fallback_surface, color, (2, 2, fallback_size-4, fallback_size-4))
         pygame.draw.rect(fallback_surface, (255, 255, 255), (0, 0, fallback_size, fallback_size), 2)
         
+        # Match the display's pixel format once so render blits need no conversion
+        if pygame.display.get_surface() is not None:
+            fallback_surface = fallback_surface.convert_alpha()
+        
         self.sprite_surface = fallback_surface
-        print(f"Created fallback animation for {self.collectible_type} collectible")
+        logger.debug("Created fallback animation for %s collectible", self.collectible_type)
     
-    def update(self, dt: float):
+    def update(self, dt: float, camera=None):
         """
         Update the collectible state.
         
         Args:
             dt: Delta time in seconds
+            camera: Optional camera; sprite animation is skipped while off-screen
         """
         if not self.is_active or self.is_collected:
             return
         
-        # Update bobbing animation
+        # Update bobbing animation (even off-screen, so the item stays in place)
         self._update_floating_movement(dt)
         
+        if camera is not None:
+            half_w = self._sprite_half_w
+            half_h = self._sprite_half_h
+            if not camera.is_visible(self.current_x - half_w, self.current_y - half_h, 2 * half_w, 2 * half_h):
+                return
+        
         # Update sprite animation
         self._update_animation(dt)
     
     def _update_floating_movement(self, dt: float):
         """Update the floating/bobbing movement."""
-        # Increment bobbing time
-        self.bob_time += dt * self.bob_speed
+        # Increment bobbing time, wrapped to one period so it never loses precision
+        bob_time = self.bob_time + dt * self.bob_speed
+        if bob_time >= _TWO_PI:
+            bob_time %= _TWO_PI
+        self.bob_time = bob_time
         
-        # Calculate bobbing offset using sine wave
-        bob_offset = math.sin(self.bob_time) * self.bob_amplitude
+        # Calculate bobbing offset using the sine lookup table
+        bob_offset = _SIN_LUT[int(bob_time * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)] * self.bob_amplitude
         
         # Update current position
         self.current_x = self.spawn_x  # No horizontal movement
@@ -171,34 +229,32 @@ class Collectible:
         if not self.animation_loader:
             return
         
-        # Get animation data
-        animation_data = self.animation_loader.get_animation(self.current_animation)
+        # Get animation data, resolved once per animation change
+        if self._cached_animation != self.current_animation:
+            self._cached_animation = self.current_animation
+            self._animation_data = self.animation_loader.get_animation(self.current_animation)
+        animation_data = self._animation_data
         if not animation_data:
             # No animation data, keep using current sprite_surface
             return
         
-        # Update animation timing
-        self.animation_time += dt
-        
-        # Get frame information
-        frame_duration = self.animation_loader.get_frame_duration(self.current_animation, self.current_frame)
-        if frame_duration and self.animation_time >= frame_duration:
-            self.animation_time = 0.0
-            
-            # Get frames for animation
-            frames = animation_data.get('surfaces_right', [])
-            if frames:
-                self.current_frame = (self.current_frame + 1) % len(frames)
+        # Update animation timing, wrapped to one loop, and look the frame up from
+        # the cumulative durations (so a long dt can skip frames)
+        end_times = animation_data.end_times
+        if not end_times:
+            return
+        total = end_times[-1]
+        if total > 0:
+            animation_time = self.animation_time + dt
+            if animation_time >= total:
+                animation_time %= total
+            self.animation_time = animation_time
+            self.current_frame = animation_data.frame_index_at(animation_time)
         
         # Get current frame surface
-        new_surface = self.animation_loader.get_frame_surface(
-            self.current_animation, 
-            self.current_frame, 
-            facing_right=True
-        )
-        
-        if new_surface:
-            self.sprite_surface = new_surface
+        current_frame = self.current_frame
+        if 0 <= current_frame < animation_data.frame_count:
+            self.sprite_surface = animation_data.surfaces_right[current_frame]
     
     def play_animation(self, animation_name: str):
         """
@@ -211,21 +267,21 @@ class Collectible:
             self.current_animation = animation_name
             self.animation_time = 0.0
             self.current_frame = 0  # Reset frame index
-            print(f"Collectible playing animation: {animation_name}")
+            logger.debug("Collectible playing animation: %s", animation_name)
     
     def get_collision_rect(self) -> pygame.Rect:
         """
         Get the collision rectangle for this collectible.
         
+        The same Rect is updated in place on every call, so copy it to keep it.
+        
         Returns:
             pygame.Rect: Collision rectangle
         """
-        return pygame.Rect(
-            self.current_x - self.collision_width // 2,
-            self.current_y - self.collision_height // 2,
-            self.collision_width,
-            self.collision_height
-        )
+        collision_rect = self._collision_rect
+        collision_rect.x = int(self.current_x - self._half_w)
+        collision_rect.y = int(self.current_y - self._half_h)
+        return collision_rect
     
     def check_player_collision(self, player_rect: pygame.Rect) -> bool:
         """
@@ -262,7 +318,7 @@ class Collectible:
         # Play collection animation
         self.play_animation("collect")
         
-        print(f"Player collected {self.collectible_type}!")
+        logger.debug("Player collected %s!", self.collectible_type)
         
         # Return collection result
         return {
@@ -282,6 +338,33 @@ class Collectible:
         # Override in specific collectible classes
         return {}
     
+    def get_blit_args(self, camera_offset_x: float, camera_offset_y: float) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Get the (surface, screen position) pair for the sprite, or None if nothing to draw.
+        
+        Args:
+            camera_offset_x: Camera X offset
+            camera_offset_y: Camera Y offset
+            
+        Returns:
+            Tuple of (surface, (x, y)) ready for Surface.blit or Surface.blits
+        """
+        if not self.is_active or self.is_collected or not self.sprite_surface:
+            return None
+        
+        # Half size is only re-read when the sprite surface changes
+        sprite_surface = self.sprite_surface
+        if sprite_surface is not self._sized_surface:
+            self._sized_surface = sprite_surface
+            self._sprite_half_w = sprite_surface.get_width() // 2
+            self._sprite_half_h = sprite_surface.get_height() // 2
+        
+        # Center the sprite on the position (rounded like Rect.center)
+        screen_x = _round_half_away(self.current_x - camera_offset_x) - self._sprite_half_w
+        screen_y = _round_half_away(self.current_y - camera_offset_y) - self._sprite_half_h
+        
+        return sprite_surface, (screen_x, screen_y)
+    
     def render(self, screen: pygame.Surface, camera_offset_x: float, camera_offset_y: float):
         """
         Render the collectible to the screen.
@@ -291,22 +374,15 @@ class Collectible:
             camera_offset_x: Camera X offset
             camera_offset_y: Camera Y offset
         """
-        if not self.is_active or self.is_collected or not self.sprite_surface:
+        blit_args = self.get_blit_args(camera_offset_x, camera_offset_y)
+        if blit_args is None:
             return
         
-        # Calculate screen position
-        screen_x = self.current_x - camera_offset_x
-        screen_y = self.current_y - camera_offset_y
-        
-        # Center the sprite on the position
-        sprite_rect = self.sprite_surface.get_rect()
-        sprite_rect.center = (screen_x, screen_y)
-        
         # Render sprite
-        screen.blit(self.sprite_surface, sprite_rect)
+        screen.blit(*blit_args)
         
         # Debug: Draw collision box
-        if hasattr(screen, '_debug_collision') and getattr(screen, '_debug_collision', False):
+        if DEBUG_COLLISION:
             collision_rect = self.get_collision_rect()
             debug_rect = pygame.Rect(
                 collision_rect.x - camera_offset_x,
@@ -326,6 +402,8 @@ class BandageCollectible(Collectible):
     sprite sheet.
     """
     
+    __slots__ = ('health_restore',)
+    
     def __init__(self, spawn_x: float, spawn_y: float, scale: int = 2):
         """
         Initialize a bandage collectible.
@@ -377,5 +455,28 @@ def create_collectible(collectible_type: str, spawn_x: float, spawn_y: float, sc
     if collectible_type in collectible_map:
         return collectible_map[collectible_type](spawn_x, spawn_y, scale)
     else:
-        print(f"Warning: Unknown collectible type '{collectible_type}', creating base Collectible")
-        return Collectible(spawn_x, spawn_y, collectible_type, scale)
\ No newline at end of file
+        logger.warning("Unknown collectible type '%s', creating base Collectible", collectible_type)
+        return Collectible(spawn_x, spawn_y, collectible_type, scale)
+
+
+def update_collectibles(collectibles, dt: float, camera=None,
+                        player_rect: Optional[pygame.Rect] = None) -> List[Collectible]:
+    """
+    Update every collectible and test it for pickup in one pass.
+    
+    Args:
+        collectibles: Collectibles to update
+        dt: Delta time in seconds
+        camera: Optional camera used to cull off-screen animation
+        player_rect: Optional player collision box to test for pickups
+        
+    Returns:
+        list: Active collectibles touching player_rect (empty without one)
+    """
+    touching = []
+    for collectible in collectibles:
+        collectible.update(dt, camera)
+        if player_rect is not None and collectible.check_player_collision(player_rect):
+            touching.append(collectible)
+            
+    return touching
@@ -1,14 +1,32 @@
 """Enemy character classes with animation and rendering."""
+import logging
+import math
 import pygame
 import random
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ..animations.enemy_animation_loader import AssassinAnimationLoader
+from ..engine.world import COLLISION_SOLID, COLLISION_PLATFORM
+
+logger = logging.getLogger(__name__)
+
+# Enemies whose feet are more than this many pixels outside the camera view skip animation updates
+_CULL_MARGIN = 128
 
 
 class Enemy:
     """Base enemy class with position, sprite rendering, and animation."""
     
+    __slots__ = ('pos_x', 'pos_y', 'velocity_x', 'velocity_y', 'on_ground',
+                 'state', 'current_frame', 'frame_timer',
+                 'scale', 'direction', 'gravity',
+                 'move_speed', 'patrol_direction', 'movement_timer', 'idle_timer', 'idle_duration', 'ai_state',
+                 'min_idle_time', 'max_idle_time', 'idle_chance',
+                 'max_health', 'health', 'is_invulnerable', 'invulnerability_timer', 'invulnerability_duration',
+                 'hit_stun_timer', 'hit_stun_duration',
+                 'death_timer', 'death_animation_duration', 'marked_for_removal',
+                 'animation_loader', '_cached_state', '_animation_data')
+    
     def __init__(self, x: float, y: float, scale: int = 2):
         # Position (pivot point - feet center)
         self.pos_x = x
@@ -58,9 +76,11 @@ class Enemy:
         
         # Animation loader (to be set by subclasses)
         self.animation_loader = None
+        self._cached_state: Optional[str] = None  # State _animation_data was resolved for
+        self._animation_data = None  # AnimationFrames of the current state
         
-    def update(self, dt: float, world_map=None):
-        """Update enemy animation, physics, and logic."""
+    def update(self, dt: float, world_map=None, camera=None):
+        """Update enemy animation, physics, and logic (animation pauses while far outside camera's view)."""
         # Update combat timers
         if self.is_invulnerable:
             self.invulnerability_timer += dt
@@ -81,14 +101,14 @@ class Enemy:
             self.death_timer += dt
             if self.death_timer >= self.death_animation_duration:
                 self.marked_for_removal = True
-                print(f"Enemy death animation complete, marked for removal")  # Debug output
+                logger.debug("Enemy death animation complete, marked for removal")
         
         # Update AI behavior (skip if dead or in hit stun)
         if self.ai_state != "death" and self.hit_stun_timer <= 0:
             self._update_ai(dt, world_map)
         
-        # Apply physics
-        self._apply_physics(dt)
+        # Apply gravity
+        self.velocity_y += self.gravity * dt
         
         # Handle collisions if world map is provided
         if world_map:
@@ -97,21 +117,26 @@ class Enemy:
             # Fallback collision (ground level)
             self._handle_basic_collision()
         
-        # Update animation timer
-        if self.animation_loader and self.state in self.animation_loader.animations:
-            animation_data = self.animation_loader.get_animation(self.state)
-            if animation_data and animation_data['durations']:
-                durations = animation_data['durations']
-                frame_duration = durations[min(self.current_frame, len(durations) - 1)]
-                self.frame_timer += dt
-                
-                if self.frame_timer >= frame_duration:
-                    self.frame_timer = 0.0
-                    
-                    # Get frame count
-                    frames = animation_data['surfaces_right']
-                    if frames:
-                        self.current_frame = (self.current_frame + 1) % len(frames)
+        # Update animation timer (AI and physics above keep running off-screen)
+        if self.animation_loader and (camera is None or camera.is_visible(
+                self.pos_x - _CULL_MARGIN, self.pos_y - _CULL_MARGIN, 2 * _CULL_MARGIN, 2 * _CULL_MARGIN)):
+            animation_data = self._current_animation()
+            if animation_data and animation_data.end_times:
+                # Frame timer wraps to one loop; the frame comes from the cumulative durations
+                total = animation_data.end_times[-1]
+                if total > 0:
+                    frame_timer = self.frame_timer + dt
+                    if frame_timer >= total:
+                        frame_timer %= total
+                    self.frame_timer = frame_timer
+                    self.current_frame = animation_data.frame_index_at(frame_timer)
+    
+    def _current_animation(self):
+        """Get the AnimationFrames for the current state, looked up again only when the state changes."""
+        if self._cached_state != self.state:
+            self._cached_state = self.state
+            self._animation_data = self.animation_loader.get_animation(self.state)
+        return self._animation_data
     
     def _update_ai(self, dt: float, world_map=None):
         """Update AI behavior logic."""
@@ -147,13 +172,13 @@ class Enemy:
             look_ahead_x = self.pos_x + (self.patrol_direction * look_ahead_distance)
             ground_check_y = self.pos_y + 10  # Check slightly below feet
             
-            if not world_map.is_solid_at_any_layer(look_ahead_x, ground_check_y) and \
-               not world_map.is_platform_at_any_layer(look_ahead_x, ground_check_y):
+            kind_at = world_map.get_collision_kind_at_any_layer
+            if kind_at(look_ahead_x, ground_check_y) not in (COLLISION_SOLID, COLLISION_PLATFORM):
                 should_turn = True  # No ground ahead, turn around
             
             # Wall detection - check if there's a wall ahead
             wall_check_y = self.pos_y - 10  # Check at body height
-            if world_map.is_solid_at_any_layer(look_ahead_x, wall_check_y):
+            if kind_at(look_ahead_x, wall_check_y) == COLLISION_SOLID:
                 should_turn = True  # Wall ahead, turn around
             
             if should_turn:
@@ -228,18 +253,18 @@ class Enemy:
             self.idle_duration = random.uniform(self.min_idle_time, self.max_idle_time)
             self.idle_timer = 0.0
     
-    def _apply_physics(self, dt: float):
-        """Apply gravity and basic physics."""
-        self.velocity_y += self.gravity * dt
-        
     def _handle_collisions(self, world_map, dt: float):
         """Handle collision detection and response with the world."""
+        kind_at = world_map.get_collision_kind_at_any_layer  # One flat-grid lookup per probe
+        tile_size = world_map.pixel_tile_size
+        tile_mask = world_map.pixel_tile_mask
+        
         # Horizontal movement with collision (AI-controlled)
         new_x = self.pos_x + self.velocity_x * dt
         
         # Check for wall collision in movement direction
         check_x = new_x + (5 if self.velocity_x > 0 else -5)  # Check ahead of enemy
-        if not world_map.is_solid_at_any_layer(check_x, self.pos_y):
+        if kind_at(check_x, self.pos_y) != COLLISION_SOLID:
             self.pos_x = new_x
         else:
             # Hit a wall - trigger direction change in AI
@@ -250,22 +275,21 @@ class Enemy:
         new_y = self.pos_y + self.velocity_y * dt
         
         if self.velocity_y > 0:  # Falling
-            # Check at foot level (slightly below pivot)
+            # Check at foot level (slightly below pivot), probing the tile once for both kinds
             foot_y = new_y + 2
+            foot_kind = kind_at(self.pos_x, foot_y)
             
             # Check for solid tiles (always stop)
-            if world_map.is_solid_at_any_layer(self.pos_x, foot_y):
-                # Find the exact ground level
-                tile_size = world_map.tile_size * world_map.scale
-                tile_y = int(foot_y // tile_size) * tile_size
+            if foot_kind == COLLISION_SOLID:
+                # Find the exact ground level (a bit mask snap for power-of-two tiles)
+                tile_y = math.floor(foot_y) & tile_mask if tile_mask is not None else int(foot_y // tile_size) * tile_size
                 self.pos_y = float(tile_y - 2)  # Stand on top of the tile
                 self.velocity_y = 0.0
                 self.on_ground = True
             # Check for platform tiles (only stop if falling onto them from above)
-            elif world_map.is_platform_at_any_layer(self.pos_x, foot_y):
+            elif foot_kind == COLLISION_PLATFORM:
                 # Only land on platform if we're falling from above
-                tile_size = world_map.tile_size * world_map.scale
-                tile_y = int(foot_y // tile_size) * tile_size
+                tile_y = math.floor(foot_y) & tile_mask if tile_mask is not None else int(foot_y // tile_size) * tile_size
                 # Check if our previous position was above this tile
                 prev_foot_y = self.pos_y + 2
                 if prev_foot_y <= tile_y:
@@ -282,7 +306,7 @@ class Enemy:
         else:  # Moving up (shouldn't happen much for basic enemies)
             # Check at head level (only solid tiles block upward movement)
             head_y = new_y - 35
-            if world_map.is_solid_at_any_layer(self.pos_x, head_y):
+            if kind_at(self.pos_x, head_y) == COLLISION_SOLID:
                 # Hit ceiling
                 self.velocity_y = 0.0
                 # Don't update position to prevent clipping into ceiling
@@ -291,7 +315,7 @@ class Enemy:
                 self.on_ground = False
                 
         # Keep enemy within map bounds
-        map_width = world_map.map_cols * world_map.tile_size * world_map.scale
+        map_width = world_map.pixel_width
         if self.pos_x < 0:
             self.pos_x = 0
         if self.pos_x > map_width:
@@ -312,46 +336,42 @@ class Enemy:
         else:
             self.on_ground = False
     
-    def render(self, screen: pygame.Surface, camera_x: float, camera_y: float):
-        """Render the enemy on screen."""
-        if not self.animation_loader or self.state not in self.animation_loader.animations:
-            return
+    def get_blit_args(self, camera_x: float, camera_y: float) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the (surface, screen position) pair for the current frame, or None if nothing to draw."""
+        if not self.animation_loader:
+            return None
             
-        # Get animation data
-        animation_data = self.animation_loader.get_animation(self.state)
-        if not animation_data:
-            return
-        
-        # Get frames based on direction
-        frames = animation_data['surfaces_right'] if self.direction > 0 else animation_data['surfaces_left']
-        pivots = animation_data['pivots_right'] if self.direction > 0 else animation_data['pivots_left']
-        
-        if not frames or self.current_frame >= len(frames):
-            return
-        
-        # Get current frame and pivot
-        current_surface = frames[self.current_frame]
-        pivot_x, pivot_y = pivots[self.current_frame] if pivots else (0, 0)
-        
-        # Calculate screen position (subtract camera offset)
-        screen_x = int(self.pos_x - camera_x - pivot_x)
-        screen_y = int(self.pos_y - camera_y - pivot_y)
+        animation_data = self._current_animation()
+        frame_index = self.current_frame
+        if animation_data is None or not 0 <= frame_index < animation_data.frame_count:
+            return None
+            
+        # Place the frame pivot on the enemy's feet (subtract camera offset)
+        if self.direction > 0:
+            surface = animation_data.surfaces_right[frame_index]
+            pivot_x, pivot_y = animation_data.pivots_right[frame_index]
+        else:
+            surface = animation_data.surfaces_left[frame_index]
+            pivot_x, pivot_y = animation_data.pivots_left[frame_index]
+        blit_args = surface, (int(self.pos_x - camera_x - pivot_x), int(self.pos_y - camera_y - pivot_y))
         
-        # Draw the sprite with flashing effect during invulnerability
+        # Flash every 0.1 seconds (10 Hz) during invulnerability
         if self.is_invulnerable:
-            # Flash every 0.1 seconds (10 Hz) during invulnerability
             flash_interval = 0.1
             if int(self.invulnerability_timer / flash_interval) % 2 == 0:
                 # Create a red-tinted surface for hit feedback
+                current_surface, screen_pos = blit_args
                 hit_surface = current_surface.copy()
                 hit_surface.fill((255, 100, 100), special_flags=pygame.BLEND_MULT)
-                screen.blit(hit_surface, (screen_x, screen_y))
-            else:
-                # Normal rendering during flash-off frames
-                screen.blit(current_surface, (screen_x, screen_y))
-        else:
-            # Normal rendering when not invulnerable
-            screen.blit(current_surface, (screen_x, screen_y))
+                return hit_surface, screen_pos
+                
+        return blit_args
+    
+    def render(self, screen: pygame.Surface, camera_x: float, camera_y: float):
+        """Render the enemy on screen."""
+        blit_args = self.get_blit_args(camera_x, camera_y)
+        if blit_args:
+            screen.blit(*blit_args)
     
     def get_position(self) -> Tuple[float, float]:
         """Get enemy position."""
@@ -365,7 +385,7 @@ class Enemy:
         
         # Apply damage
         self.health -= damage
-        print(f"Enemy hit! Health: {self.health}/{self.max_health}")  # Debug output
+        logger.debug("Enemy hit! Health: %d/%d", self.health, self.max_health)
         
         # Enter hit state
         self.ai_state = "hit"
@@ -392,21 +412,99 @@ class Enemy:
         self.current_frame = 0
         self.frame_timer = 0.0
         self.velocity_x = 0.0
-        print(f"Enemy died!")  # Debug output
+        logger.debug("Enemy died!")
 
 
 class AssassinEnemy(Enemy):
     """Assassin enemy that uses the Assassin.json animation data."""
     
+    __slots__ = ()
+    
     def __init__(self, x: float, y: float, scale: int = 2):
         super().__init__(x, y, scale)
         
         # Load Assassin animations using the new modular system
         aseprite_json_path = "Assests/enemies/assassin/Assassin.json"
         self.animation_loader = AssassinAnimationLoader(aseprite_json_path, scale)
-        self.animation_loader.load_assassin_animations()
+        self.animation_loader.load_enemy_animations()
         
         # Set initial state to idle
         self.state = "idle"
         self.current_frame = 0
-        self.frame_timer = 0.0
\ No newline at end of file
+        self.frame_timer = 0.0
+
+def update_enemies(enemies, dt: float, world_map=None, camera=None):
+    """
+    Step every enemy for one frame (timers, AI, physics, collisions, animation).
+    
+    The single per-frame entry point for the enemy population, so work that
+    spans all enemies has one place to live.
+    
+    Args:
+        enemies: Enemies to update
+        dt: Delta time in seconds
+        world_map: World used for collisions (basic ground collision if None)
+        camera: Optional camera used to cull off-screen animation
+    """
+    for enemy in enemies:
+        enemy.update(dt, world_map, camera)
+
+
+class EnemyGrid:
+    """
+    Uniform grid of enemies keyed by the cell under their feet.
+    
+    Rebuilt once per frame, so area checks (attack boxes, contact with the
+    player) only look at enemies in nearby cells instead of every enemy.
+    Cells must be at least as large as an enemy's collision box.
+    """
+    
+    __slots__ = ('cell_size', 'cells')
+    
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Tuple[int, Enemy]]] = {}
+        
+    def rebuild(self, enemies):
+        """Re-index every enemy at its current position."""
+        cell_size = self.cell_size
+        cells = self.cells = {}
+        for index, enemy in enumerate(enemies):
+            key = (int(enemy.pos_x // cell_size), int(enemy.pos_y // cell_size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [(index, enemy)]
+            else:
+                bucket.append((index, enemy))
+                
+    def clear(self):
+        """Forget every indexed enemy."""
+        self.cells = {}
+        
+    def query(self, x: float, y: float, width: float, height: float) -> List[Enemy]:
+        """
+        Get the enemies whose collision boxes may overlap a rectangle, in their original order.
+        
+        Args:
+            x, y: Top-left corner of the rectangle in world pixels
+            width, height: Rectangle size in world pixels
+            
+        Returns:
+            Candidate enemies; callers still run their exact overlap test
+        """
+        cell_size = self.cell_size
+        cells = self.cells
+        # One extra cell on each side covers boxes that reach past their feet's cell
+        min_cell_x = int(x // cell_size) - 1
+        max_cell_x = int((x + width) // cell_size) + 1
+        min_cell_y = int(y // cell_size) - 1
+        max_cell_y = int((y + height) // cell_size) + 1
+        
+        found = []
+        for cell_y in range(min_cell_y, max_cell_y + 1):
+            for cell_x in range(min_cell_x, max_cell_x + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    found.extend(bucket)
+        found.sort(key=lambda entry: entry[0])
+        return [enemy for _, enemy in found]
@@ -4,8 +4,8 @@ import pygame
 from typing import Optional, List
 
 from .player import Player
-from .enemy import Enemy, AssassinEnemy
-from .collectible import create_collectible, Collectible
+from .enemy import Enemy, AssassinEnemy, EnemyGrid, update_enemies
+from .collectible import create_collectible, update_collectibles, Collectible
 from .interactables import Chest
 from ..engine.world import World
 from ..engine.camera import Camera
@@ -48,10 +48,14 @@ class Game:
         
         # Debug settings
         self.debug_collision = False
+        self.verbose = os.environ.get("VERBOSE") == "1"  # Log map loading details at INFO
         
         # Game settings
         self.scale = 2
         
+        # Enemies indexed by position for attack and contact checks (cells twice an enemy's width)
+        self.enemy_grid = EnemyGrid(40 * self.scale)
+        
     def _get_auto_exit_time(self) -> Optional[float]:
         """Get auto-exit time from environment variable."""
         try:
@@ -163,7 +167,7 @@ class Game:
         """Initialize game objects for the selected map."""
         try:
             # Load world
-            self.world = World(self.game_state.get_selected_map_path(), scale=self.scale)
+            self.world = World(self.game_state.get_selected_map_path(), scale=self.scale, verbose=self.verbose)
             print(f"Loaded world: {self.world.map_cols}x{self.world.map_rows} tiles")
             
             # Initialize camera
@@ -295,12 +299,11 @@ class Game:
             self.player.update(dt, input_state, self.world)
             
             # Update enemies
-            for enemy in self.enemies:
-                enemy.update(dt, self.world)
+            update_enemies(self.enemies, dt, self.world, self.camera)
             
-            # Update collectibles
-            for collectible in self.collectibles:
-                collectible.update(dt)
+            # Update collectibles, finding the ones the player touches in the same pass
+            touched_collectibles = update_collectibles(self.collectibles, dt, self.camera,
+                                                       self._get_player_pickup_rect())
             
             # Update chests
             for chest in self.chests:
@@ -311,6 +314,7 @@ class Game:
             
             # Remove dead enemies
             self._remove_dead_enemies()
+            self.enemy_grid.rebuild(self.enemies)
             
             # Check for player attacks hitting enemies
             self._check_player_enemy_collisions()
@@ -319,7 +323,7 @@ class Game:
             self._check_enemy_player_collisions()
             
             # Check for player collecting items
-            self._check_player_collectible_collisions()
+            self._check_player_collectible_collisions(touched_collectibles)
             
             # Check if player requested respawn
             if self.player.respawn_requested:
@@ -352,7 +356,7 @@ class Game:
         player_tile_y = int(self.player.pos_y // (self.world.tile_size * self.world.scale))
         
         for obj in death_objects:
-            if obj.get('x') == player_tile_x and obj.get('y') == player_tile_y:
+            if obj.x == player_tile_x and obj.y == player_tile_y:
                 self._respawn_player()
                 return
                 
@@ -392,8 +396,8 @@ class Game:
         elif self.player.is_slam_attacking:
             damage = int(damage * self.player.slam_damage_multiplier)  # Enhanced damage for slam attack
             
-        # Check collision with each enemy
-        for enemy in self.enemies:
+        # Check collision with each enemy near the attack box
+        for enemy in self.enemy_grid.query(attack_box['x'], attack_box['y'], attack_box['width'], attack_box['height']):
             # Only hit enemies that haven't been hit during this attack
             if (id(enemy) not in self.player.enemies_hit_this_attack and 
                 self._check_enemy_hit_by_attack(enemy, attack_box)):
@@ -491,8 +495,8 @@ class Game:
         player_x = self.player.pos_x - player_width // 2
         player_y = self.player.pos_y - player_height
         
-        # Check collision with each enemy
-        for enemy in self.enemies:
+        # Check collision with each enemy near the player
+        for enemy in self.enemy_grid.query(player_x, player_y, player_width, player_height):
             if enemy.ai_state == "death":  # Skip dead enemies
                 continue
                 
@@ -513,50 +517,53 @@ class Game:
                     print(f"Player hit by enemy! Health: {self.player.health}/{self.player.max_health}")
                     break  # Only hit by one enemy per frame
     
-    def _check_player_collectible_collisions(self):
-        """Check for collisions between player and collectibles."""
+    def _get_player_pickup_rect(self) -> Optional[pygame.Rect]:
+        """Get the player's collision box for picking up collectibles, or None if the player can't."""
         if not self.player or self.player.is_dead:
-            return
-        
-        # Player collision box
+            return None
+            
         player_width = 20 * self.scale
         player_height = 35 * self.scale
-        player_rect = pygame.Rect(
+        return pygame.Rect(
             self.player.pos_x - player_width // 2,
             self.player.pos_y - player_height,
             player_width,
             player_height
         )
+    
+    def _check_player_collectible_collisions(self, touched_collectibles: List[Collectible]):
+        """Collect the collectibles the player touched this frame (found by update_collectibles)."""
+        if not self.player or self.player.is_dead:
+            return
         
-        # Check collision with each collectible
         collectibles_to_remove = []
-        for i, collectible in enumerate(self.collectibles):
-            if collectible.check_player_collision(player_rect):
-                # Player touched the collectible
-                result = collectible.collect(self.player)
+        for collectible in touched_collectibles:
+            # Player touched the collectible
+            result = collectible.collect(self.player)
+            
+            if result.get('collected', False):
+                # Apply collection effects
+                effects = result.get('effects', {})
                 
-                if result.get('collected', False):
-                    # Apply collection effects
-                    effects = result.get('effects', {})
-                    
-                    # Handle health restoration
-                    if 'health_restore' in effects:
-                        health_restored = effects['health_restore']
-                        old_health = self.player.health
-                        self.player.health = min(self.player.max_health, self.player.health + health_restored)
-                        actual_restored = self.player.health - old_health
-                        print(f"Health restored: +{actual_restored} (Total: {self.player.health}/{self.player.max_health})")
-                    
-                    # Show collection message
-                    if 'message' in effects:
-                        print(f"Collectible effect: {effects['message']}")
-                    
-                    # Mark for removal
-                    collectibles_to_remove.append(i)
-        
-        # Remove collected items in reverse order to avoid index shifting
-        for i in reversed(collectibles_to_remove):
-            del self.collectibles[i]
+                # Handle health restoration
+                if 'health_restore' in effects:
+                    health_restored = effects['health_restore']
+                    old_health = self.player.health
+                    self.player.health = min(self.player.max_health, self.player.health + health_restored)
+                    actual_restored = self.player.health - old_health
+                    print(f"Health restored: +{actual_restored} (Total: {self.player.health}/{self.player.max_health})")
+                
+                # Show collection message
+                if 'message' in effects:
+                    print(f"Collectible effect: {effects['message']}")
+                
+                # Mark for removal
+                collectibles_to_remove.append(collectible)
+        
+        # Remove collected items
+        if collectibles_to_remove:
+            self.collectibles[:] = [collectible for collectible in self.collectibles
+                                    if collectible not in collectibles_to_remove]
     
     def _check_player_chest_interactions(self, input_state: dict):
         """Check for player interactions with chests."""
@@ -626,17 +633,21 @@ class Game:
             # Render world
             self.world.render(self.screen, camera_x, camera_y)
             
-            # Render collectibles (behind player and enemies)
-            for collectible in self.collectibles:
-                collectible.render(self.screen, camera_x, camera_y)
+            # Render collectibles (behind player and enemies) in a single batched blit
+            collectible_blits = [blit_args for blit_args in
+                                 (collectible.get_blit_args(camera_x, camera_y) for collectible in self.collectibles)
+                                 if blit_args]
+            self.screen.blits(collectible_blits, doreturn=False)
             
             # Render chests (behind player and enemies)
             for chest in self.chests:
                 chest.render(self.screen, camera_x, camera_y)
             
-            # Render enemies
-            for enemy in self.enemies:
-                enemy.render(self.screen, camera_x, camera_y)
+            # Render enemies in a single batched blit
+            enemy_blits = [blit_args for blit_args in
+                           (enemy.get_blit_args(camera_x, camera_y) for enemy in self.enemies)
+                           if blit_args]
+            self.screen.blits(enemy_blits, doreturn=False)
             
             # Render player
             self.player.draw(self.screen, camera_x, camera_y)
@@ -770,5 +781,6 @@ class Game:
         self.world = None
         self.camera = None
         self.enemies.clear()
+        self.enemy_grid.clear()
         self.collectibles.clear()
         self.chests.clear()
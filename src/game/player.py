@@ -736,15 +736,14 @@ class Player:
             
             # Check multiple points along player's height
             check_points = [
-                self.pos_y - 30,  # Upper body
-                self.pos_y - 15,  # Middle body  
-                self.pos_y - 5    # Lower body
+                (check_x, self.pos_y - 30),  # Upper body
+                (check_x, self.pos_y - 15),  # Middle body  
+                (check_x, self.pos_y - 5)    # Lower body
             ]
             
             # If any point hits a solid tile, we found a wall
-            for check_y in check_points:
-                if world_map.is_solid_at_any_layer(check_x, check_y):
-                    return -1 if check_side == 'left' else 1
+            if any(world_map.is_solid_at_any_layer_many(check_points)):
+                return -1 if check_side == 'left' else 1
                     
         return 0  # No wall found
     
@@ -919,7 +918,7 @@ class Player:
         elif self.state == "wall_transition":
             # Check if transition animation is complete
             transition_animation = self.animation_loader.get_animation('wall_transition')
-            if transition_animation and self.current_frame >= len(transition_animation['surfaces_right']) - 1:
+            if transition_animation and self.current_frame >= len(transition_animation.surfaces_right) - 1:
                 self.state = "wall_slide"
                 self.current_frame = 0
                 self.frame_timer = 0.0
@@ -929,7 +928,7 @@ class Player:
         elif self.state == "wall_slide_stop":
             # Check if stop animation is complete, then hold
             stop_animation = self.animation_loader.get_animation('wall_slide_stop')
-            if stop_animation and self.current_frame >= len(stop_animation['surfaces_right']) - 1:
+            if stop_animation and self.current_frame >= len(stop_animation.surfaces_right) - 1:
                 self.state = "wall_hold"
                 self.current_frame = 0
                 self.frame_timer = 0.0
@@ -963,14 +962,10 @@ class Player:
         
         # Check horizontal collision at multiple points (upper and middle body)
         check_points = [
-            self.pos_y - 30,  # Upper body
-            self.pos_y - 15,  # Middle body
+            (new_x, self.pos_y - 30),  # Upper body
+            (new_x, self.pos_y - 15),  # Middle body
         ]
-        can_move = True
-        for check_y in check_points:
-            if world_map.is_solid_at_any_layer(new_x, check_y):
-                can_move = False
-                break
+        can_move = not any(world_map.is_solid_at_any_layer_many(check_points))
                 
         if can_move:
             self.pos_x = new_x
@@ -1110,7 +1105,7 @@ class Player:
             desired = self.state
             in_air = not self.on_ground
             trans_animation = self.animation_loader.get_animation('trans')
-            trans_available = trans_animation and len(trans_animation['surfaces_right']) > 0
+            trans_available = trans_animation and len(trans_animation.surfaces_right) > 0
             
             # Handle attack states (highest priority)
             if self.is_attacking:
@@ -1146,7 +1141,7 @@ class Player:
         
         animation_data = self.animation_loader.get_animation(self.state)
         if animation_data:
-            frames = animation_data['surfaces_right'] if self.direction > 0 else animation_data['surfaces_left']
+            frames = animation_data.surfaces_right if self.direction > 0 else animation_data.surfaces_left
             
             if frames and frame_duration > 0:
                 if self.frame_timer >= frame_duration:
@@ -1219,8 +1214,8 @@ class Player:
         animation_data = self.animation_loader.get_animation(self.state)
         if animation_data:
             # Use new format
-            frames = animation_data['surfaces_right'] if self.direction > 0 else animation_data['surfaces_left']
-            pivots = animation_data['pivots_right'] if self.direction > 0 else animation_data['pivots_left']
+            frames = animation_data.surfaces_right if self.direction > 0 else animation_data.surfaces_left
+            pivots = animation_data.pivots_right if self.direction > 0 else animation_data.pivots_left
         else:
             # Fallback to legacy format
             frames_right, frames_left, pivots_right, pivots_left = self.animation_loader.get_legacy_format(self.state)
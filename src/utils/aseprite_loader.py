@@ -1,9 +1,20 @@
 """Aseprite animation loader for parsing JSON animation data."""
 import json
+import logging
 import os
+import sys
+import weakref
 from typing import Dict, List, Tuple, Optional, Any
 import pygame
 
+logger = logging.getLogger(__name__)
+
+# Sprite sheets, sliced frame surfaces and parsed JSON shared by every loader in the process.
+# Values are held weakly, so a sheet is released once no loader or entity uses it.
+_SHEET_REGISTRY: "weakref.WeakValueDictionary[Any, pygame.Surface]" = weakref.WeakValueDictionary()
+_FRAME_REGISTRY: "weakref.WeakValueDictionary[tuple, pygame.Surface]" = weakref.WeakValueDictionary()
+_DATA_REGISTRY: "weakref.WeakValueDictionary[str, _ParsedAseprite]" = weakref.WeakValueDictionary()
+
 
 class AsepriteFrame:
     """Represents a single frame from Aseprite data."""
@@ -56,6 +67,19 @@ class AsepriteAnimation:
         return sum(frame.duration for frame in self.frames) / 1000.0
 
 
+class _ParsedAseprite:
+    """Parsed JSON tables for one Aseprite file, shared by every loader reading it."""
+    
+    __slots__ = ('frames', 'animations', 'frame_index_map', 'pivot_point', '__weakref__')
+    
+    def __init__(self, frames: Dict[str, AsepriteFrame], animations: Dict[str, AsepriteAnimation],
+                 frame_index_map: Dict[int, str], pivot_point: Tuple[int, int]):
+        self.frames = frames
+        self.animations = animations
+        self.frame_index_map = frame_index_map
+        self.pivot_point = pivot_point
+
+
 class AsepriteLoader:
     """Loads and parses Aseprite JSON animation data."""
     
@@ -69,6 +93,9 @@ class AsepriteLoader:
             self.image_path = base_path + ".png"
         else:
             self.image_path = image_path
+        self._image_key = os.path.abspath(self.image_path)
+        self._data_key = os.path.abspath(json_path)
+        self._parsed: Optional[_ParsedAseprite] = None
             
         self.sprite_sheet: Optional[pygame.Surface] = None
         self.frames: Dict[str, AsepriteFrame] = {}
@@ -77,35 +104,59 @@ class AsepriteLoader:
         
         # Frame name to index mapping (for frameTag references)
         self.frame_index_map: Dict[int, str] = {}
+        self._loaded = False
+        
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the JSON data and sprite sheet have been parsed successfully."""
+        return self._loaded
         
     def load(self) -> bool:
         """Load and parse the Aseprite JSON file."""
         try:
-            # Load JSON data
-            with open(self.json_path, 'r') as f:
-                data = json.load(f)
-                
-            # Load sprite sheet image
-            if os.path.exists(self.image_path):
-                self.sprite_sheet = pygame.image.load(self.image_path).convert_alpha()
+            # Reuse JSON tables already parsed by another loader
+            parsed = _DATA_REGISTRY.get(self._data_key)
+            if parsed is None:
+                with open(self.json_path, 'r') as f:
+                    data = json.load(f)
             else:
-                print(f"Warning: Sprite sheet not found at {self.image_path}")
-                return False
+                data = None
                 
-            # Parse frames
-            self._parse_frames(data.get("frames", {}))
-            
-            # Parse animations from frameTags
-            self._parse_animations(data.get("meta", {}).get("frameTags", []))
-            
-            # Parse pivot point from slices
-            self._parse_pivot(data.get("meta", {}).get("slices", []))
+            # Load sprite sheet image (reusing one already decoded by another loader)
+            sprite_sheet = _SHEET_REGISTRY.get(self._image_key)
+            if sprite_sheet is None:
+                if not os.path.exists(self.image_path):
+                    logger.warning("Sprite sheet not found at %s", self.image_path)
+                    return False
+                sprite_sheet = pygame.image.load(self.image_path).convert_alpha()
+                _SHEET_REGISTRY[self._image_key] = sprite_sheet
+            self.sprite_sheet = sprite_sheet
+                
+            if parsed is None:
+                # Parse frames
+                self._parse_frames(data.get("frames", {}))
+                
+                # Parse animations from frameTags
+                self._parse_animations(data.get("meta", {}).get("frameTags", []))
+                
+                # Parse pivot point from slices
+                self._parse_pivot(data.get("meta", {}).get("slices", []))
+                
+                parsed = _ParsedAseprite(self.frames, self.animations, self.frame_index_map, self.pivot_point)
+                _DATA_REGISTRY[self._data_key] = parsed
+            else:
+                self.frames = parsed.frames
+                self.animations = parsed.animations
+                self.frame_index_map = parsed.frame_index_map
+                self.pivot_point = parsed.pivot_point
+            self._parsed = parsed
             
-            print(f"Loaded {len(self.frames)} frames and {len(self.animations)} animations")
+            logger.debug("Loaded %d frames and %d animations", len(self.frames), len(self.animations))
+            self._loaded = True
             return True
             
         except Exception as e:
-            print(f"Error loading Aseprite data: {e}")
+            logger.warning("Error loading Aseprite data: %s", e)
             return False
             
     def _parse_frames(self, frames_data: Dict[str, Any]):
@@ -122,7 +173,7 @@ class AsepriteLoader:
     def _parse_animations(self, frame_tags: List[Dict[str, Any]]):
         """Parse animation data from frameTags."""
         for tag in frame_tags:
-            name = tag["name"]
+            name = sys.intern(tag["name"])
             from_frame = tag["from"]
             to_frame = tag["to"]
             direction = tag.get("direction", "forward")
@@ -153,29 +204,58 @@ class AsepriteLoader:
                     pivot_x = bounds.get("x", 0) + pivot.get("x", 0)
                     pivot_y = bounds.get("y", 0) + pivot.get("y", 0)
                     self.pivot_point = (pivot_x, pivot_y)
-                    print(f"Found pivot point at ({pivot_x}, {pivot_y})")
+                    logger.debug("Found pivot point at (%d, %d)", pivot_x, pivot_y)
                     break
                     
     def get_animation(self, name: str) -> Optional[AsepriteAnimation]:
         """Get an animation by name."""
         return self.animations.get(name)
         
+    def _frame_key(self, frame: AsepriteFrame, flipped: bool) -> tuple:
+        """Build the shared-registry key for a frame of this sprite sheet."""
+        return (self._image_key, self.scale, frame.x, frame.y, frame.width, frame.height, flipped)
+        
+    def _get_atlas(self, flipped: bool) -> pygame.Surface:
+        """Get the sprite sheet scaled (and optionally mirrored) as one shared atlas surface."""
+        key = (self._image_key, self.scale, flipped)
+        atlas = _SHEET_REGISTRY.get(key)
+        if atlas is None:
+            if flipped:
+                atlas = pygame.transform.flip(self._get_atlas(False), True, False)
+            elif self.scale != 1:
+                sheet_width, sheet_height = self.sprite_sheet.get_size()
+                atlas = pygame.transform.scale(self.sprite_sheet, (sheet_width * self.scale, sheet_height * self.scale))
+            else:
+                atlas = self.sprite_sheet
+            _SHEET_REGISTRY[key] = atlas
+        return atlas
+        
+    def _atlas_frame(self, frame: AsepriteFrame, flipped: bool) -> pygame.Surface:
+        """View a frame inside the shared atlas (subsurface shares pixels, no copy)."""
+        key = self._frame_key(frame, flipped)
+        frame_surface = _FRAME_REGISTRY.get(key)
+        if frame_surface is None:
+            atlas = self._get_atlas(flipped)
+            scale = self.scale
+            x = frame.x * scale
+            if flipped:
+                x = atlas.get_width() - x - frame.width * scale
+            frame_rect = pygame.Rect(x, frame.y * scale, frame.width * scale, frame.height * scale)
+            frame_surface = atlas.subsurface(frame_rect)
+            _FRAME_REGISTRY[key] = frame_surface
+        return frame_surface
+        
     def get_frame_surface(self, frame: AsepriteFrame) -> pygame.Surface:
         """Extract a frame surface from the sprite sheet."""
         if not self.sprite_sheet:
             return pygame.Surface((frame.width, frame.height))
-            
-        # Extract frame from sprite sheet
-        frame_surface = pygame.Surface((frame.width, frame.height), pygame.SRCALPHA)
-        frame_rect = pygame.Rect(frame.x, frame.y, frame.width, frame.height)
-        frame_surface.blit(self.sprite_sheet, (0, 0), frame_rect)
+        return self._atlas_frame(frame, False)
         
-        # Scale if needed
-        if self.scale != 1:
-            scaled_size = (frame.width * self.scale, frame.height * self.scale)
-            frame_surface = pygame.transform.scale(frame_surface, scaled_size)
-            
-        return frame_surface
+    def get_flipped_frame_surface(self, frame: AsepriteFrame) -> pygame.Surface:
+        """Get a horizontally flipped (left-facing) frame surface."""
+        if not self.sprite_sheet:
+            return pygame.Surface((frame.width, frame.height))
+        return self._atlas_frame(frame, True)
         
     def get_scaled_pivot(self) -> Tuple[int, int]:
         """Get the pivot point scaled for current scale factor."""